@@ -0,0 +1,89 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Optional
+
+from analytics.metrics import compute_metrics_from_df
+from db import SessionLocal, engine
+from llm.adapter import json_dumps
+from models import Statement, Transaction, User
+from pipeline.core import TRANSACTION_DF_COLUMNS, transactions_to_df
+
+
+# ==================================================
+# MULTI-USER METRICS (BATCH REPORTING / CRON)
+# ==================================================
+# Users are independent, so their metrics are computed in separate
+# processes (pandas work holds the GIL; threads would not scale).
+#
+#   python -m analytics.batch [user_id ...]   (default: every user)
+
+def _init_worker():
+    # Forked workers must not reuse the parent's pooled connections
+    engine.dispose(close=False)
+
+
+def _user_metrics(user_id: int) -> Optional[Dict]:
+    # Own, unscoped session: closing it never touches the caller's
+    # thread-scoped SessionLocal (the workers == 1 path runs in-process)
+    db = SessionLocal.session_factory()
+    try:
+        txns = (
+            db.query(*TRANSACTION_DF_COLUMNS)
+            .join(Statement, Transaction.statement_id == Statement.id)
+            .filter(Statement.user_id == user_id)
+            .all()
+        )
+
+        if not txns:
+            return None
+
+        metrics, _ = compute_metrics_from_df(transactions_to_df(txns))
+        return metrics
+
+    finally:
+        db.close()
+
+
+def compute_all_metrics(
+    user_ids: Iterable[int],
+    max_workers: Optional[int] = None,
+) -> Dict[int, Optional[Dict]]:
+    """
+    user_id -> compute_metrics_from_df metrics (None if no transactions),
+    one worker process per core by default.
+    """
+    user_ids = list(user_ids)
+    if not user_ids:
+        return {}
+
+    workers = min(max_workers or os.cpu_count() or 1, len(user_ids))
+
+    if workers == 1:
+        return {user_id: _user_metrics(user_id) for user_id in user_ids}
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+    ) as executor:
+        return dict(zip(user_ids, executor.map(_user_metrics, user_ids)))
+
+
+def main(argv: list[str]) -> None:
+    if argv:
+        user_ids = [int(a) for a in argv]
+    else:
+        db = SessionLocal.session_factory()
+        try:
+            user_ids = [uid for (uid,) in db.query(User.id).order_by(User.id)]
+        finally:
+            db.close()
+
+    results = compute_all_metrics(user_ids)
+
+    # orjson only takes str keys
+    print(json_dumps({str(k): v for k, v in results.items()}).decode())
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
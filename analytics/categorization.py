@@ -1,11 +1,12 @@
+import numpy as np
 import pandas as pd
 import re
 from typing import Tuple, Optional
 
 from agent.categories import CATEGORIES
-from analytics.merchant_normalizer import normalize_merchant
+from analytics.merchant_normalizer import merchant_columns
 from analytics.llm_categorizer import (
-    llm_categorize_merchant,
+    categorize_many,
     looks_like_person_name,
     is_micro_consumable,
 )
@@ -183,33 +184,32 @@ def add_categories(df: pd.DataFrame) -> pd.DataFrame:
 
     df = df.copy()
 
-    merchant_data = df["description"].apply(normalize_merchant)
-    df["merchant"] = merchant_data.apply(
-        lambda x: (x.get("merchant_name") or "").upper()
+    df["merchant"], df["upi_id"] = merchant_columns(
+        df["description"].tolist()
     )
-    df["upi_id"] = merchant_data.apply(lambda x: x.get("upi_id"))
 
-    unique_merchants = df["merchant"].unique()
-    llm_cache = {
-        m: llm_categorize_merchant(m)
-        for m in unique_merchants if m
-    }
-
-    results = df.apply(
-        lambda row: categorize_transaction(
-            row["description"],
-            row["merchant"],
-            row["upi_id"],
-            row["amount"],
-            llm_cache,
-        ),
-        axis=1,
-        result_type="expand",
+    unique_merchants = [m for m in df["merchant"].unique() if m]
+    llm_cache = dict(
+        zip(unique_merchants, categorize_many(unique_merchants))
     )
 
-    df["category"] = results[0]
-    df["category_confidence"] = results[1]
-    df["category_source"] = results[2]
+    # Rules run over zipped columns: a row-wise df.apply builds a pandas
+    # Series per row, which cost several times the rules themselves
+    results = [
+        categorize_transaction(description, merchant, upi_id, amount, llm_cache)
+        for description, merchant, upi_id, amount in zip(
+            df["description"].tolist(),
+            df["merchant"].tolist(),
+            df["upi_id"].tolist(),
+            df["amount"].tolist(),
+        )
+    ]
+
+    df["category"] = [r[0] for r in results]
+    df["category_confidence"] = np.array(
+        [r[1] for r in results], dtype=np.float64
+    )
+    df["category_source"] = [r[2] for r in results]
 
     allowed = set(CATEGORIES) | {
         "Income",
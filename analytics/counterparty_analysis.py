@@ -17,14 +17,16 @@ def upi_counterparty_summary(df: pd.DataFrame, top_n: int = 10) -> pd.DataFrame:
     if "upi_id" not in df.columns:
         raise ValueError("upi_id column missing")
 
-    upi_df = df[df["upi_id"].notna()].copy()
+    # upi_id comes precomputed (merchant_fields, cached per narration);
+    # only the two columns the aggregation reads are copied
+    upi_df = df.loc[df["upi_id"].notna(), ["upi_id", "amount"]]
 
     if upi_df.empty:
         return pd.DataFrame(columns=[
             "upi_id", "transaction_count", "total_amount"
         ])
 
-    upi_df["abs_amount"] = upi_df["amount"].abs()
+    upi_df = upi_df.assign(abs_amount=upi_df["amount"].abs())
 
     summary = (
         upi_df
@@ -1,8 +1,58 @@
-import json
+import logging
 import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from threading import Lock
 
-from llm.adapter import generate_text, is_llm_enabled
+from llm.adapter import generate_text, is_llm_enabled, json_loads
+
+try:
+    from config.llm import LLM_PROVIDER, OLLAMA_NUM_PARALLEL
+except ImportError:
+    LLM_PROVIDER = "ollama"
+    OLLAMA_NUM_PARALLEL = 1
+
+try:
+    from config.llm import LLM_CATEGORIZE_BATCH
+except ImportError:
+    LLM_CATEGORIZE_BATCH = 1
+
+
+logger = logging.getLogger(__name__)
+
+
+# ==================================================
+# SERVER CONCURRENCY CHECK
+# ==================================================
+_serial_server_warned = False
+
+
+def _warn_serial_server(workers: int) -> None:
+    """
+    Warn (once per process) when a caller asks categorize_many for
+    parallel LLM calls that an OLLAMA_NUM_PARALLEL=1 server would run
+    one at a time anyway.
+    """
+    global _serial_server_warned
+
+    if (
+        _serial_server_warned
+        or workers <= 1
+        or OLLAMA_NUM_PARALLEL > 1
+        or LLM_PROVIDER != "ollama"
+        or not is_llm_enabled()
+    ):
+        return
+
+    _serial_server_warned = True
+    logger.warning(
+        "categorize_many requested %d workers but OLLAMA_NUM_PARALLEL=1: "
+        "the Ollama server runs them serially. Set OLLAMA_NUM_PARALLEL=4+ "
+        "on the Ollama server and the backend.",
+        workers,
+    )
 
 
 # ==================================================
@@ -77,7 +127,7 @@ def rescale_confidence(confidence: float) -> float:
 
 # 🔧 UPDATED: supports ALL-CAPS bank statements
 PERSON_NAME_RX = re.compile(
-    r"^[A-Z ]{3,}$",
+    r"[A-Z ]{3,}",
     re.I
 )
 
@@ -95,7 +145,7 @@ def looks_like_person_name(name: str) -> bool:
     if name.isupper() and 1 <= len(name.split()) <= 3:
         return True
 
-    return bool(PERSON_NAME_RX.match(name))
+    return bool(PERSON_NAME_RX.fullmatch(name))
 
 
 # ==================================================
@@ -112,10 +162,43 @@ def is_micro_consumable(category: str, amount: float) -> bool:
     )
 
 
+# ==================================================
+# NEGATIVE CACHE (FAILED LLM CALLS)
+# ==================================================
+# merchant -> monotonic expiry; failures are NOT memoized by lru_cache,
+# so a recovered server is retried once the TTL lapses.
+_NEG_CACHE: dict[str, float] = {}
+_NEG_CACHE_TTL = 60  # seconds
+_NEG_CACHE_MAX = 1024
+_NEG_CACHE_LOCK = Lock()
+
+
+class _LLMCallFailed(Exception):
+    pass
+
+
+def _remember_failure(merchant: str) -> None:
+    with _NEG_CACHE_LOCK:
+        _NEG_CACHE.pop(merchant, None)
+        if len(_NEG_CACHE) >= _NEG_CACHE_MAX:
+            _NEG_CACHE.pop(next(iter(_NEG_CACHE)))
+        _NEG_CACHE[merchant] = time.monotonic() + _NEG_CACHE_TTL
+
+
+def _recently_failed(merchant: str) -> bool:
+    expires = _NEG_CACHE.get(merchant)
+    if expires is None:
+        return False
+    if expires > time.monotonic():
+        return True
+    with _NEG_CACHE_LOCK:
+        _NEG_CACHE.pop(merchant, None)
+    return False
+
+
 # ==================================================
 # LLM CATEGORIZATION (BACKEND ONLY)
 # ==================================================
-@lru_cache(maxsize=1024)
 def llm_categorize_merchant(merchant: str) -> tuple[str, float]:
     """
     Backend-only semantic categorization.
@@ -131,6 +214,27 @@ def llm_categorize_merchant(merchant: str) -> tuple[str, float]:
     if not is_llm_enabled():
         return "Other", 0.0
 
+    if _recently_failed(merchant):
+        return "Other", 0.0
+
+    batched = _batch_result(merchant)
+    if batched is not None:
+        return batched
+
+    try:
+        return _llm_categorize_merchant(merchant)
+    except _LLMCallFailed:
+        _remember_failure(merchant)
+        return "Other", 0.0
+
+
+@lru_cache(maxsize=1024)
+def _llm_categorize_merchant(merchant: str) -> tuple[str, float]:
+    """
+    Cached LLM call. Raises _LLMCallFailed (never cached) when the
+    LLM is unreachable or returns unparseable output.
+    """
+
     # -------------------------------
     # Prompt
     # -------------------------------
@@ -161,37 +265,190 @@ Output:
         )
 
         if not raw:
-            return "Other", 0.0
+            raise _LLMCallFailed("empty LLM response")
 
         # -------------------------------
         # Strict JSON extraction
         # -------------------------------
         start, end = raw.find("{"), raw.rfind("}") + 1
         if start == -1 or end == -1:
-            return "Other", 0.0
+            raise _LLMCallFailed("no JSON in LLM response")
 
-        data = json.loads(raw[start:end])
+        data = json_loads(raw[start:end])
 
         category = data.get("category", "Other")
         confidence = float(data.get("confidence", 0.0))
 
-        # -------------------------------
-        # Output validation
-        # -------------------------------
-        if category not in ALLOWED_CATEGORIES:
-            return "Other", 0.0
+    except _LLMCallFailed:
+        raise
+    except Exception as exc:
+        raise _LLMCallFailed(str(exc)) from exc
 
-        confidence = max(0.0, min(confidence, 1.0))
-        confidence = rescale_confidence(confidence)
+    return _validated(merchant, category, confidence)
+
+
+def _validated(merchant: str, category, confidence: float) -> tuple[str, float]:
+    """
+    Output validation shared by the single and batched prompts.
+    """
+    if category not in ALLOWED_CATEGORIES:
+        return "Other", 0.0
 
-        # 🔥 NEW: cap confidence for unknown / uppercase merchants
-        if merchant.isupper() and category in ("Food", "Shopping"):
-            confidence = min(confidence, 0.75)
+    confidence = max(0.0, min(confidence, 1.0))
+    confidence = rescale_confidence(confidence)
 
-        return category, confidence
+    # 🔥 NEW: cap confidence for unknown / uppercase merchants
+    if merchant.isupper() and category in ("Food", "Shopping"):
+        confidence = min(confidence, 0.75)
 
+    return category, confidence
+
+
+# ==================================================
+# MICRO-BATCHED CATEGORIZATION (LLM_CATEGORIZE_BATCH > 1)
+# ==================================================
+# Several merchants per prompt: the system prompt + category list are
+# sent once per batch instead of once per merchant. Parsed results land in
+# a bounded per-merchant cache that llm_categorize_merchant consults first;
+# merchants a batch reply misses (or a failed batch) fall back to the
+# single-merchant prompt.
+_BATCH_RESULTS: "OrderedDict[str, tuple[str, float]]" = OrderedDict()
+_BATCH_RESULTS_MAX = 4096
+_BATCH_RESULTS_LOCK = Lock()
+
+
+def _batch_result(merchant: str) -> tuple[str, float] | None:
+    with _BATCH_RESULTS_LOCK:
+        result = _BATCH_RESULTS.get(merchant)
+        if result is not None:
+            _BATCH_RESULTS.move_to_end(merchant)
+        return result
+
+
+def _store_batch_results(results: dict[str, tuple[str, float]]) -> None:
+    with _BATCH_RESULTS_LOCK:
+        for merchant, result in results.items():
+            _BATCH_RESULTS[merchant] = result
+            _BATCH_RESULTS.move_to_end(merchant)
+        while len(_BATCH_RESULTS) > _BATCH_RESULTS_MAX:
+            _BATCH_RESULTS.popitem(last=False)
+
+
+def _llm_categorize_batch(merchants: list[str]) -> dict[str, tuple[str, float]]:
+    """
+    One prompt for several merchants. Returns the merchants whose entry
+    parsed ({} when the call or the JSON fails).
+    """
+    listing = "\n".join(
+        f'{i}. "{m}"' for i, m in enumerate(merchants, 1)
+    )
+
+    prompt = f"""
+{SYSTEM_PROMPT}
+
+Allowed categories:
+{ALLOWED_CATEGORIES}
+
+Merchants (categorize EACH one independently):
+{listing}
+
+Output ONE JSON object keyed by merchant number:
+{{ "1": {{ "category": "...", "confidence": 0.0 }}, "2": ... }}
+"""
+
+    raw = generate_text(
+        prompt=prompt,
+        temperature=0.0,
+        top_p=1.0,
+        timeout=20 + 2 * len(merchants),
+        return_none_on_fail=True,
+        model="qwen2.5:1.5b",
+    )
+    if not raw:
+        return {}
+
+    start, end = raw.find("{"), raw.rfind("}") + 1
+    if start == -1 or end == 0:
+        return {}
+
+    try:
+        data = json_loads(raw[start:end])
     except Exception:
-        return "Other", 0.0
+        return {}
+
+    if not isinstance(data, dict):
+        return {}
+
+    results = {}
+    for i, merchant in enumerate(merchants, 1):
+        entry = data.get(str(i))
+        if not isinstance(entry, dict):
+            continue
+        try:
+            confidence = float(entry.get("confidence", 0.0))
+        except (TypeError, ValueError):
+            continue
+        results[merchant] = _validated(
+            merchant, entry.get("category", "Other"), confidence
+        )
+
+    return results
+
+
+def _prefetch_batches(merchants: list[str], workers: int) -> None:
+    """
+    Categorize not-yet-known merchants LLM_CATEGORIZE_BATCH at a time.
+    """
+    pending = list(dict.fromkeys(
+        m for m in merchants
+        if m and _batch_result(m) is None and not _recently_failed(m)
+    ))
+    if not pending:
+        return
+
+    size = LLM_CATEGORIZE_BATCH
+    batches = [pending[i:i + size] for i in range(0, len(pending), size)]
+    workers = min(workers, len(batches))
+
+    if workers <= 1:
+        results = [_llm_categorize_batch(b) for b in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_llm_categorize_batch, batches))
+
+    for r in results:
+        _store_batch_results(r)
+
+
+# ==================================================
+# BATCH CATEGORIZATION (THREAD POOL)
+# ==================================================
+def categorize_many(
+    merchants,
+    workers: int | None = None,
+) -> list[tuple[str, float]]:
+    """
+    Categorize many merchants, overlapping blocking LLM calls.
+
+    Pool size is capped by OLLAMA_NUM_PARALLEL so the client never
+    queues more requests than the server can run. With
+    LLM_CATEGORIZE_BATCH > 1, merchants are first classified in batches.
+    """
+    merchants = list(merchants)
+
+    if workers and len(merchants) > 1:
+        _warn_serial_server(workers)
+
+    if LLM_CATEGORIZE_BATCH > 1 and is_llm_enabled():
+        _prefetch_batches(merchants, workers or OLLAMA_NUM_PARALLEL)
+
+    workers = min(workers or OLLAMA_NUM_PARALLEL, len(merchants))
+
+    if workers <= 1:
+        return [llm_categorize_merchant(m) for m in merchants]
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(llm_categorize_merchant, merchants))
 
 
 # ==================================================
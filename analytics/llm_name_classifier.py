@@ -1,10 +1,9 @@
 # analytics/llm_name_classifier.py
 
-import json
 import re
 from functools import lru_cache
 
-from llm.adapter import generate_text, is_llm_enabled
+from llm.adapter import generate_text, is_llm_enabled, json_loads
 
 
 # ==================================================
@@ -90,7 +89,7 @@ Output:
         if start == -1 or end == -1:
             return True  # finance-safe default
 
-        result = json.loads(raw[start:end])
+        result = json_loads(raw[start:end])
 
         return result.get("type") == "BUSINESS"
 
@@ -106,7 +105,7 @@ Output:
 # ---- NEW: deterministic heuristics (fast & free) ----
 
 PERSON_NAME_RX = re.compile(
-    r"^[A-Z][a-z]+(\s+[A-Z][a-z]+){0,2}$"
+    r"[A-Z][a-z]+(\s+[A-Z][a-z]+){0,2}"
 )
 
 BUSINESS_KEYWORDS = {
@@ -116,6 +115,13 @@ BUSINESS_KEYWORDS = {
     "limited", "ltd", "pvt", "private", "company", "co",
 }
 
+# One alternation instead of a per-keyword loop. Plain substrings, like
+# `kw in name.lower()`: "SHOPPERS STOP", "R K STORES" and "Costco" are
+# businesses by design, so no word boundaries
+BUSINESS_RX = re.compile(
+    "|".join(map(re.escape, sorted(BUSINESS_KEYWORDS, key=len, reverse=True)))
+)
+
 def heuristic_is_business(name: str) -> tuple[bool | None, float]:
     """
     Cheap deterministic classifier.
@@ -124,13 +130,12 @@ def heuristic_is_business(name: str) -> tuple[bool | None, float]:
     if not name:
         return None, 0.0
 
-    n = name.lower().strip()
+    n = name.strip()
 
-    for kw in BUSINESS_KEYWORDS:
-        if kw in n:
-            return True, 0.9
+    if BUSINESS_RX.search(n.lower()):
+        return True, 0.9
 
-    if PERSON_NAME_RX.match(name.strip()):
+    if PERSON_NAME_RX.fullmatch(n):
         return False, 0.8
 
     return None, 0.0
@@ -1,7 +1,7 @@
 # analytics/merchant_memory.py
 
 import re
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
 # ==================================================
 # MERCHANT OVERRIDES (AUTHORITATIVE MEMORY)
@@ -52,6 +52,9 @@ MERCHANT_OVERRIDES = {
 # ==================================================
 # NORMALIZATION
 # ==================================================
+NON_ALNUM_RX = re.compile(r"[^a-z0-9 ]+")
+WS_RX = re.compile(r"\s+")
+
 
 def normalize_merchant_key(text: str) -> str:
     """
@@ -61,8 +64,8 @@ def normalize_merchant_key(text: str) -> str:
         return ""
 
     text = text.lower()
-    text = re.sub(r"[^a-z0-9 ]+", " ", text)
-    return re.sub(r"\s+", " ", text).strip()
+    text = NON_ALNUM_RX.sub(" ", text)
+    return WS_RX.sub(" ", text).strip()
 
 
 # ==================================================
@@ -102,3 +105,15 @@ def save_merchant_category(
     Currently does nothing by design.
     """
     return None
+
+
+def save_merchant_categories(
+    items: Iterable[Tuple[str, str]],
+    confidence: Optional[float] = None,
+) -> None:
+    """
+    Batch form of save_merchant_category for (merchant, category) pairs,
+    so a real backing store can persist them in one write.
+    Currently does nothing by design.
+    """
+    return None
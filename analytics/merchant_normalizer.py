@@ -1,6 +1,7 @@
 # analytics/merchant_normalizer.py
 
 import re
+from functools import lru_cache
 
 # =====================================================
 # EXISTING CODE (UNCHANGED)
@@ -19,6 +20,9 @@ VPA_REGEX = re.compile(
     re.IGNORECASE
 )
 UPI_PATH_RX = re.compile(r"upi/([^/]+)/(\d{6,})", re.IGNORECASE)
+DIGIT_RX = re.compile(r"\d+")
+WS_RX = re.compile(r"\s+")
+SEP_RX = re.compile(r"[._\-]")
 
 def normalize_text(text: str) -> str:
     if not text:
@@ -27,14 +31,14 @@ def normalize_text(text: str) -> str:
     t = text.lower()
 
     # remove numbers
-    t = re.sub(r"\d+", " ", t)
+    t = DIGIT_RX.sub(" ", t)
 
     # remove noise tokens
     for token in NOISE_TOKENS:
         t = t.replace(token, " ")
 
     # collapse spaces
-    t = re.sub(r"\s+", " ", t).strip()
+    t = WS_RX.sub(" ", t).strip()
 
     return t or "unknown"
 
@@ -73,6 +77,25 @@ def normalize_merchant(description: str) -> dict:
         "upi_id": upi_id
     }
 
+
+@lru_cache(maxsize=65536)
+def merchant_fields(description: str) -> tuple:
+    """
+    (MERCHANT_NAME, upi_id) for a narration, cached: the same UPI /
+    NEFT narrations repeat across rows, statements and requests.
+    Returns a tuple so cached results cannot be mutated by callers.
+    """
+    result = normalize_merchant(description)
+    return (result.get("merchant_name") or "").upper(), result.get("upi_id")
+
+
+def merchant_columns(descriptions) -> tuple[list, list]:
+    """
+    merchant + upi_id columns for a description column, in one pass.
+    """
+    fields = [merchant_fields(d) for d in descriptions]
+    return [m for m, _ in fields], [u for _, u in fields]
+
 # =====================================================
 # 🔥 ADDITIONS BELOW — ZERO BREAKING CHANGES
 # =====================================================
@@ -102,7 +125,7 @@ def canonicalize_merchant_name(name: str) -> str:
     n = name.lower()
 
     # normalize separators
-    n = re.sub(r"[._\-]", " ", n)
+    n = SEP_RX.sub(" ", n)
 
     parts = []
     for p in n.split():
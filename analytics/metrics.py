@@ -1,31 +1,184 @@
+import re
+
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow  # noqa: F401  (enables read_csv engine="pyarrow")
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+try:
+    from numba import njit
+except ImportError:  # optional: NumPy reduceat fallback
+    njit = None
+
+# Transaction CSV schema. Money stays float64: balances in the
+# lakhs/crores need >7 significant digits to reconcile to the paisa.
+# Only the 0-1 confidence is narrowed.
+CSV_DTYPES = {
+    "deposit": "float64",
+    "withdrawal": "float64",
+    "balance": "float64",
+    "amount": "float64",
+    "confidence": "float32",
+}
+
 
 # ==================================================
 # HELPERS
 # ==================================================
+OPENING_BALANCE_RX = re.compile(
+    r"opening\s+balance|brought\s+forward",
+    re.IGNORECASE,
+)
+
+
 def is_opening_balance_row(row):
     """
     Detect true opening balance rows so they can be excluded
     from transaction-based analytics.
     """
-    desc = str(row.get("description", "")).lower()
+    desc = str(row.get("description_norm", row.get("description", "")))
 
     return (
         row.get("deposit", 0) > 0
         and row.get("withdrawal", 0) == 0
         and row.get("balance", -1) == row.get("deposit", -2)
-        and any(k in desc for k in ["opening balance", "brought forward"])
+        and OPENING_BALANCE_RX.search(desc) is not None
+    )
+
+
+def normalize_descriptions(descriptions: pd.Series) -> pd.Series:
+    """
+    Canonical lowercased / stripped description text.
+    Computed once at ingestion and stored as `description_norm`.
+    """
+    return descriptions.fillna("").astype(str).str.lower().str.strip()
+
+
+def description_norm(df: pd.DataFrame) -> pd.Series:
+    """
+    Precomputed `description_norm` column, or derive it for frames
+    that were not built by a loader.
+    """
+    if "description_norm" in df.columns:
+        return df["description_norm"]
+    return normalize_descriptions(df["description"])
+
+
+def opening_balance_mask(df: pd.DataFrame) -> np.ndarray:
+    """
+    Vectorized is_opening_balance_row over a whole DataFrame.
+    Returns a boolean array aligned with df rows.
+    """
+    mask = (
+        (df["deposit"] > 0)
+        & (df["withdrawal"] == 0)
+        & (df["balance"] == df["deposit"])
+        & description_norm(df).str.contains(OPENING_BALANCE_RX, na=False)
+    )
+
+    return mask.to_numpy(dtype=bool)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _segment_sums(codes, deposits, withdrawals):
+        """
+        Single pass over sorted month codes: flush the running
+        income / expense sums whenever the code changes.
+        """
+        n = codes.shape[0]
+        keys = np.empty(n, dtype=codes.dtype)
+        income = np.empty(n, dtype=np.float64)
+        expense = np.empty(n, dtype=np.float64)
+
+        k = 0
+        keys[0] = codes[0]
+        income[0] = 0.0
+        expense[0] = 0.0
+
+        for i in range(n):
+            if codes[i] != keys[k]:
+                k += 1
+                keys[k] = codes[i]
+                income[k] = 0.0
+                expense[k] = 0.0
+            income[k] += deposits[i]
+            expense[k] += withdrawals[i]
+
+        return keys[:k + 1], income[:k + 1], expense[:k + 1]
+else:
+    _segment_sums = None
+
+
+def _monthly_totals(df_txn: pd.DataFrame) -> pd.DataFrame:
+    """
+    Per-month income / expense sums (rows with unparseable dates dropped,
+    like groupby).
+
+    Month codes are sorted only when the input is not already in date
+    order, then reduced with the Numba kernel if available, otherwise
+    with np.add.reduceat (no groupby hash table either way).
+    """
+    months = df_txn["date"].to_numpy(dtype="datetime64[ns]").astype(
+        "datetime64[M]"
     )
+    # Missing amounts count as 0, as groupby().sum() skips NaN; both the
+    # Numba kernel and reduceat would turn the whole month into NaN
+    deposits = df_txn["deposit"].fillna(0.0).to_numpy(dtype=np.float64)
+    withdrawals = df_txn["withdrawal"].fillna(0.0).to_numpy(dtype=np.float64)
+
+    valid = ~np.isnat(months)
+    if not valid.all():
+        months = months[valid]
+        deposits = deposits[valid]
+        withdrawals = withdrawals[valid]
+
+    if len(months) == 0:
+        return pd.DataFrame(columns=["month", "income", "expense"])
+
+    codes = months.astype(np.int64)
+
+    # Statements arrive in date order; skip the argsort in that case
+    if not (codes[1:] >= codes[:-1]).all():
+        order = np.argsort(codes, kind="stable")
+        codes = codes[order]
+        deposits = deposits[order]
+        withdrawals = withdrawals[order]
+
+    if _segment_sums is not None:
+        keys, income, expense = _segment_sums(codes, deposits, withdrawals)
+    else:
+        keys, starts = np.unique(codes, return_index=True)
+        income = np.add.reduceat(deposits, starts)
+        expense = np.add.reduceat(withdrawals, starts)
+
+    return pd.DataFrame({
+        "month": np.datetime_as_string(
+            keys.astype("datetime64[M]"), unit="M"
+        ),
+        "income": income,
+        "expense": expense,
+    })
 
 
 # ==================================================
 # CORE METRICS (DATAFRAME-BASED)
 # ==================================================
-def compute_metrics_from_df(df: pd.DataFrame):
+def compute_metrics_from_df(
+    df: pd.DataFrame,
+    *,
+    opening_mask: np.ndarray | None = None,
+):
     """
     Compute deterministic financial metrics from a transactions DataFrame.
 
+    opening_mask: precomputed opening_balance_mask(df), so callers that
+    also run compute_data_quality_metrics evaluate it only once.
+
     Guarantees:
     - No LLM involvement
     - Order-independent
@@ -51,18 +204,33 @@ def compute_metrics_from_df(df: pd.DataFrame):
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
-    # ---------- Normalize ----------
-    df = df.copy()
-    df["date"] = pd.to_datetime(df["date"])
-
     # ---------- Remove ONLY true opening balance ----------
-    df_txn = df.loc[
-        ~df.apply(is_opening_balance_row, axis=1)
-    ].copy()
+    if opening_mask is None:
+        opening_mask = opening_balance_mask(df)
+
+    df_txn = df.loc[~opening_mask]
+
+    # ---------- Normalize ----------
+    # Loaders (transactions_to_df, compute_metrics_from_csv) already type
+    # the date column; only untyped frames from other callers get parsed.
+    if not pd.api.types.is_datetime64_any_dtype(df_txn["date"]):
+        df_txn = df_txn.assign(
+            date=pd.to_datetime(df_txn["date"], errors="coerce")
+        )
 
     # ---------- Core totals ----------
-    total_income = round(float(df_txn["deposit"].sum()), 2)
-    total_expense = round(float(df_txn["withdrawal"].sum()), 2)
+    # One 3-column reduction for income, expense and confidence
+    values = df_txn[["deposit", "withdrawal", "confidence"]].to_numpy(
+        dtype=np.float64
+    )
+    sums = np.nansum(values, axis=0)
+    confidence_count = int(np.count_nonzero(~np.isnan(values[:, 2])))
+
+    total_income = round(float(sums[0]), 2)
+    total_expense = round(float(sums[1]), 2)
+    avg_confidence = (
+        float(sums[2]) / confidence_count if confidence_count else 0.0
+    )
     net_cashflow = round(total_income - total_expense, 2)
 
     # ---------- Safety invariant ----------
@@ -71,16 +239,7 @@ def compute_metrics_from_df(df: pd.DataFrame):
     )
 
     # ---------- Monthly aggregation ----------
-    df_txn["month"] = df_txn["date"].dt.to_period("M").astype(str)
-
-    monthly_summary = (
-        df_txn
-        .groupby("month", as_index=False)
-        .agg(
-            income=("deposit", "sum"),
-            expense=("withdrawal", "sum"),
-        )
-    )
+    monthly_summary = _monthly_totals(df_txn)
 
     monthly_summary["savings"] = (
         monthly_summary["income"] - monthly_summary["expense"]
@@ -88,12 +247,22 @@ def compute_metrics_from_df(df: pd.DataFrame):
 
     monthly_summary = monthly_summary.round(2)
 
+    # ---------- Chart records (one pass over the column arrays) ----------
+    monthly_timeseries = [
+        {"month": m, "income": i, "expense": e, "savings": s}
+        for m, i, e, s in zip(
+            monthly_summary["month"].tolist(),
+            monthly_summary["income"].tolist(),
+            monthly_summary["expense"].tolist(),
+            monthly_summary["savings"].tolist(),
+        )
+    ]
+
     # ---------- Monthly cashflow (legacy compatibility) ----------
-    monthly_cashflow = (
-        monthly_summary[["month", "savings"]]
-        .rename(columns={"savings": "amount"})
-        .to_dict(orient="records")
-    )
+    monthly_cashflow = [
+        {"month": row["month"], "amount": row["savings"]}
+        for row in monthly_timeseries
+    ]
 
     # ---------- UI-normalized metrics (NO NaN EVER) ----------
     monthly_income = total_income
@@ -121,25 +290,47 @@ def compute_metrics_from_df(df: pd.DataFrame):
 
         # Charts
         "monthly_cashflow": monthly_cashflow,
-        "monthly_timeseries": monthly_summary.to_dict(orient="records"),
+        "monthly_timeseries": monthly_timeseries,
 
         # Confidence / audit
-        "avg_confidence": round(float(df_txn["confidence"].mean()), 3),
+        "avg_confidence": round(avg_confidence, 3),
     }
 
     return metrics, df_txn
 
 
+# ==================================================
+# CSV ENTRYPOINT (OFFLINE PIPELINE)
+# ==================================================
+def compute_metrics_from_csv(csv_path):
+    """
+    Load a save_transactions_csv() export and compute metrics.
+    Parsed by Arrow's multithreaded reader when pyarrow is installed.
+    """
+    df = pd.read_csv(
+        csv_path,
+        engine=CSV_ENGINE,
+        parse_dates=["date"],
+        dtype=CSV_DTYPES,
+    )
+    return compute_metrics_from_df(df)
+
+
 # ==================================================
 # 🔥 ADDITIONS BELOW (NO EXISTING CODE MODIFIED)
 # ==================================================
 
 # ---- NEW: data quality diagnostics ----
 
-def compute_data_quality_metrics(df: pd.DataFrame) -> dict:
+def compute_data_quality_metrics(
+    df: pd.DataFrame,
+    *,
+    opening_mask: np.ndarray | None = None,
+) -> dict:
     """
     Returns diagnostics about data health & trustworthiness.
     Purely additive — does not affect financial metrics.
+    Accepts the same precomputed opening_mask as compute_metrics_from_df.
     """
     if df.empty:
         return {
@@ -149,7 +340,8 @@ def compute_data_quality_metrics(df: pd.DataFrame) -> dict:
             "avg_confidence": 0.0,
         }
 
-    opening_mask = df.apply(is_opening_balance_row, axis=1)
+    if opening_mask is None:
+        opening_mask = opening_balance_mask(df)
 
     return {
         "row_count": int(len(df)),
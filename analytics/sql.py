@@ -0,0 +1,145 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, case, func, not_, select
+from sqlalchemy.orm import Session
+
+from analytics.metrics import OPENING_BALANCE_RX
+from models import Statement, Transaction
+
+
+# ==================================================
+# SQL-SIDE MONTHLY AGGREGATION (POSTGRES)
+# ==================================================
+# KPI payloads only need per-month sums, so the database aggregates and
+# returns ~one row per month instead of every transaction. Semantics
+# mirror compute_metrics_from_df (opening balance excluded, confidence
+# defaults to 1.0).
+
+def _deposit():
+    return case((Transaction.amount > 0, Transaction.amount), else_=0.0)
+
+
+def _withdrawal():
+    return case((Transaction.amount < 0, -Transaction.amount), else_=0.0)
+
+
+def _is_opening_balance():
+    return and_(
+        Transaction.amount > 0,
+        Transaction.description.op("~*")(OPENING_BALANCE_RX.pattern),
+        func.coalesce(Transaction.raw["balance"].as_float(), -1.0)
+        == Transaction.amount,
+    )
+
+
+def fetch_monthly_summary(
+    db: Session,
+    user_id: int,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> List[Dict]:
+    """
+    One GROUP BY query → [{month, income, expense, confidence_sum,
+    txn_count}] ordered by month ("YYYY-MM").
+    """
+    month = func.to_char(
+        func.date_trunc("month", Transaction.date), "YYYY-MM"
+    ).label("month")
+
+    confidence = func.coalesce(Transaction.raw["confidence"].as_float(), 1.0)
+
+    stmt = (
+        select(
+            month,
+            func.sum(_deposit()).label("income"),
+            func.sum(_withdrawal()).label("expense"),
+            func.sum(confidence).label("confidence_sum"),
+            func.count(Transaction.id).label("txn_count"),
+        )
+        .join(Statement, Transaction.statement_id == Statement.id)
+        .where(Statement.user_id == user_id)
+        .where(not_(_is_opening_balance()))
+        .group_by(month)
+        .order_by(month)
+    )
+
+    if start_date:
+        stmt = stmt.where(Transaction.date >= start_date)
+
+    if end_date:
+        stmt = stmt.where(Transaction.date < end_date)
+
+    return [
+        {
+            "month": row.month,
+            "income": float(row.income or 0.0),
+            "expense": float(row.expense or 0.0),
+            "confidence_sum": float(row.confidence_sum or 0.0),
+            "txn_count": int(row.txn_count),
+        }
+        for row in db.execute(stmt)
+    ]
+
+
+def compute_summary_metrics(
+    db: Session,
+    user_id: int,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> Dict | None:
+    """
+    KPI payload with the same keys as compute_metrics_from_df's metrics,
+    built from fetch_monthly_summary. Returns None when there is no data.
+    """
+    months = fetch_monthly_summary(db, user_id, start_date, end_date)
+
+    if not months:
+        return None
+
+    total_income = round(sum(m["income"] for m in months), 2)
+    total_expense = round(sum(m["expense"] for m in months), 2)
+    net_cashflow = round(total_income - total_expense, 2)
+
+    txn_count = sum(m["txn_count"] for m in months)
+    avg_confidence = (
+        sum(m["confidence_sum"] for m in months) / txn_count
+        if txn_count
+        else 0.0
+    )
+
+    monthly_timeseries = [
+        {
+            "month": m["month"],
+            "income": round(m["income"], 2),
+            "expense": round(m["expense"], 2),
+            "savings": round(m["income"] - m["expense"], 2),
+        }
+        for m in months
+    ]
+
+    monthly_savings = max(total_income - total_expense, 0.0)
+    savings_rate = (
+        monthly_savings / total_income
+        if total_income > 0
+        else 0.0
+    )
+
+    return {
+        "total_income": total_income,
+        "total_expense": total_expense,
+        "net_cashflow": net_cashflow,
+
+        "monthly_income": total_income,
+        "monthly_expense": total_expense,
+        "monthly_savings": round(monthly_savings, 2),
+        "savings_rate": round(savings_rate, 4),
+
+        "monthly_cashflow": [
+            {"month": row["month"], "amount": row["savings"]}
+            for row in monthly_timeseries
+        ],
+        "monthly_timeseries": monthly_timeseries,
+
+        "avg_confidence": round(avg_confidence, 3),
+    }
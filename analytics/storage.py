@@ -1,8 +1,21 @@
+from pathlib import Path
 from typing import List, Dict
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
+from analytics.metrics import CSV_DTYPES, normalize_descriptions
 from models import Transaction
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # optional: pandas writer fallback
+    pa = None
+    pacsv = None
+
 
 def save_transactions_db(
     *,
@@ -22,19 +35,21 @@ def save_transactions_db(
     if not transactions:
         raise ValueError("No transactions to save")
 
-    db.bulk_save_objects(
+    # Core executemany: no per-row ORM object construction / instrumentation
+    db.execute(
+        insert(Transaction),
         [
-            Transaction(
-                statement_id=statement_id,
-                date=t["date"],
-                description=t["description"],
-                merchant=t.get("merchant"),
-                amount=t["amount"],
-                txn_type=t.get("type"),
-                raw=t,
-            )
+            {
+                "statement_id": statement_id,
+                "date": t["date"],
+                "description": t["description"],
+                "merchant": t.get("merchant"),
+                "amount": t["amount"],
+                "txn_type": t.get("type"),
+                "raw": t,
+            }
             for t in transactions
-        ]
+        ],
     )
 
     db.commit()
@@ -55,11 +70,40 @@ def compute_transaction_fingerprint(txn: Dict) -> str:
     parts = [
         str(txn.get("date")),
         str(txn.get("amount")),
-        str(txn.get("description", "")).lower().strip(),
+        txn.get("description_norm")
+        or str(txn.get("description", "")).lower().strip(),
     ]
     return "|".join(parts)
 
 
+def compute_transaction_fingerprints(transactions: List[Dict]) -> pd.Series:
+    """
+    Column-wise compute_transaction_fingerprint for a whole batch.
+    Reuses a precomputed `description_norm` when the rows carry one.
+    """
+    frame = pd.DataFrame(
+        transactions,
+        columns=["date", "amount", "description", "description_norm"],
+        dtype=object,
+    )
+
+    # Empty counts as missing, like the `or` in the scalar version
+    desc_norm = frame["description_norm"]
+    missing = desc_norm.isna() | (desc_norm == "")
+    if missing.any():
+        desc_norm = desc_norm.where(
+            ~missing, normalize_descriptions(frame["description"])
+        )
+
+    return (
+        frame["date"].map(str)
+        + "|"
+        + frame["amount"].map(str)
+        + "|"
+        + desc_norm
+    )
+
+
 # ---- NEW: safe bulk insert wrapper ----
 
 def save_transactions_db_safe(
@@ -100,17 +144,72 @@ def deduplicate_transactions(
     Removes exact duplicates in-memory before DB insert.
     Safe no-op for clean data.
     """
-    seen = set()
-    unique = []
+    if not transactions:
+        return []
+
+    keep = ~compute_transaction_fingerprints(transactions).duplicated()
+
+    # Return the original dicts (first occurrence wins), not re-built rows
+    return [txn for txn, k in zip(transactions, keep.to_numpy()) if k]
+
+
+# ---- NEW: CSV export (offline pipeline handoff) ----
+
+DEFAULT_CSV_PATH = Path("output/transactions_clean.csv")
+
+
+def transactions_frame(transactions: List[Dict]) -> pd.DataFrame:
+    """
+    Extracted transactions as the CSV-schema DataFrame:
 
-    for txn in transactions:
-        fp = compute_transaction_fingerprint(txn)
-        if fp in seen:
-            continue
-        seen.add(fp)
-        unique.append(txn)
+    - Exact duplicates dropped
+    - CSV_DTYPES applied
+    - `description_norm` stored so readers skip re-normalizing
 
-    return unique
+    compute_metrics_from_df accepts it directly (no CSV round trip).
+    """
+    if not transactions:
+        raise ValueError("No transactions to save")
+
+    df = pd.DataFrame(deduplicate_transactions(transactions))
+    df = df.astype({c: t for c, t in CSV_DTYPES.items() if c in df.columns})
+
+    if "description" in df.columns:
+        df["description_norm"] = normalize_descriptions(df["description"])
+
+    return df
+
+
+def write_transactions_csv(
+    df: pd.DataFrame,
+    csv_path: str | Path = DEFAULT_CSV_PATH,
+) -> Path:
+    """
+    Write a transactions_frame() to CSV, with Arrow's C++ CSV writer when
+    pyarrow is installed.
+    """
+    csv_path = Path(csv_path)
+    csv_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if pacsv is not None:
+        pacsv.write_csv(
+            pa.Table.from_pandas(df, preserve_index=False),
+            csv_path,
+        )
+    else:
+        df.to_csv(csv_path, index=False)
+
+    return csv_path
+
+
+def save_transactions_csv(
+    transactions: List[Dict],
+    csv_path: str | Path = DEFAULT_CSV_PATH,
+) -> Path:
+    """
+    Write extracted transactions to CSV (transactions_frame schema).
+    """
+    return write_transactions_csv(transactions_frame(transactions), csv_path)
 
 
 # ---- NEW: audit helper ----
@@ -125,9 +224,13 @@ def summarize_transactions(transactions: List[Dict]) -> Dict:
             "total_amount": 0.0,
         }
 
+    amounts = np.fromiter(
+        (t.get("amount") or 0.0 for t in transactions),
+        dtype=np.float64,
+        count=len(transactions),
+    )
+
     return {
         "count": len(transactions),
-        "total_amount": round(
-            sum(float(t.get("amount", 0)) for t in transactions), 2
-        ),
+        "total_amount": round(float(amounts.sum()), 2),
     }
@@ -1,13 +1,39 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+import base64
+import binascii
+import multiprocessing
 import os
-import tempfile
-from datetime import datetime
-
-from sqlalchemy import text
-from sqlalchemy.orm import Session
-
-from db import engine, SessionLocal
-from models import User, FinancialGoal, InsightSnapshot
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from threading import Lock
+
+from sqlalchemy import (
+    Date,
+    Integer,
+    String,
+    bindparam,
+    column,
+    select,
+    text,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from db import engine, SessionLocal, install_query_counter
+from models import (
+    User,
+    FinancialGoal,
+    InsightSnapshot,
+    ParseJob,
+    Statement,
+    Transaction,
+)
 
 from agent.goal_parser import parse_user_goals
 from pipeline.core import (
@@ -16,7 +42,15 @@ from pipeline.core import (
     generate_insights_view,
     run_agent_view,
 )
-from llm.adapter import check_llm_health
+from analytics.sql import compute_summary_metrics
+from response_cache import (
+    analytics_key,
+    insights_key,
+    get_cached,
+    set_cached,
+    invalidate_user,
+)
+from llm.adapter import check_llm_health, json_loads
 
 from flask_cors import CORS
 from dateutil.relativedelta import relativedelta
@@ -27,6 +61,11 @@ from flask_limiter.errors import RateLimitExceeded
 
 from werkzeug.exceptions import RequestEntityTooLarge
 
+try:
+    import orjson
+except ImportError:  # optional speedup, Flask's stdlib json fallback
+    orjson = None
+
 from flask_jwt_extended import (
     JWTManager,
     create_access_token,
@@ -48,6 +87,46 @@ except ValueError:
     max_upload_mb = 15
 app.config["MAX_CONTENT_LENGTH"] = max_upload_mb * 1024 * 1024
 
+# --------------------------------------------------
+# Background statement parsing (?async=true uploads)
+# --------------------------------------------------
+try:
+    parse_workers = max(1, int(os.getenv("PARSE_WORKERS", "2")))
+except ValueError:
+    parse_workers = 2
+_PARSE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=parse_workers,
+    thread_name_prefix="parse",
+)
+
+# Jobs only live in this process's thread pool (at-most-once): if the
+# worker is recycled, times out or restarts, its queued / running jobs are
+# lost. parse_job_status reports unfinished jobs older than this as errors
+# so clients stop polling. Defaults to the gunicorn worker timeout.
+try:
+    parse_job_timeout_s = int(
+        os.getenv("PARSE_JOB_TIMEOUT_S", os.getenv("GUNICORN_TIMEOUT", "300"))
+    )
+except ValueError:
+    parse_job_timeout_s = 300
+
+# PARSE_PROCESSES=N: run the CPU-bound extraction (layout, schema search,
+# row extraction) in N worker processes so concurrent parses use several
+# cores; the DB writes stay on the request / parse thread. 0 = in-thread.
+try:
+    parse_processes = max(0, int(os.getenv("PARSE_PROCESSES", "0")))
+except ValueError:
+    parse_processes = 0
+_PARSE_PROCESS_POOL = (
+    ProcessPoolExecutor(
+        max_workers=parse_processes,
+        # spawn: never fork a process that already runs threads + a pool
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    if parse_processes
+    else None
+)
+
 # 🔐 JWT CORE CONFIG (ORDER MATTERS)
 app.config["JWT_SECRET_KEY"] = os.getenv("JWT_SECRET_KEY", "super-secret-key")
 app.config["JWT_ACCESS_TOKEN_EXPIRES"] = False
@@ -122,14 +201,142 @@ CORS(
     allow_headers=["Content-Type", "Authorization"],
 )
 
+# ==================================================
+# JSON RESPONSES
+# ==================================================
+if orjson is not None:
+    ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    class ORJSONProvider(DefaultJSONProvider):
+        """
+        orjson (C) for every jsonify / dict response. date & datetime are
+        encoded natively as ISO 8601; anything else orjson does not know
+        (Decimal, UUID, ...) falls back to Flask's default handler.
+        """
+
+        def dumps(self, obj, **kwargs):
+            return self.dumps_bytes(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+        def response(self, *args, **kwargs):
+            # Skip the bytes -> str -> bytes round trip of dumps()
+            return self._app.response_class(
+                self.dumps_bytes(self._prepare_response_obj(args, kwargs)),
+                mimetype=self.mimetype,
+            )
+
+        def dumps_bytes(self, obj) -> bytes:
+            return orjson.dumps(
+                obj,
+                default=self.default,
+                option=ORJSON_OPTIONS,
+            )
+
+    app.json = ORJSONProvider(app)
+
+else:
+    class ISODateJSONProvider(DefaultJSONProvider):
+        """
+        stdlib fallback that encodes date / datetime as ISO 8601 like the
+        orjson provider (Flask's default would emit HTTP dates), so
+        routes can return them as-is.
+        """
+
+        @staticmethod
+        def default(o):
+            if isinstance(o, (date, datetime)):
+                return o.isoformat()
+            return DefaultJSONProvider.default(o)
+
+    app.json = ISODateJSONProvider(app)
+
+
+def json_bytes(obj) -> bytes:
+    """
+    Encode with the app's JSON provider (for streamed bodies).
+    """
+    if orjson is not None:
+        return app.json.dumps_bytes(obj)
+    return app.json.dumps(obj).encode()
+
+
+# ==================================================
+# DB SESSION LIFECYCLE
+# ==================================================
+@app.teardown_appcontext
+def remove_db_session(_exc=None):
+    # SessionLocal is a scoped_session: every SessionLocal() call within a
+    # request returns the same session (one pool checkout per request);
+    # it is closed and its connection returned to the pool here.
+    SessionLocal.remove()
+
+
+# Dev aid: QUERY_COUNT_WARN=N flags requests running more than N queries
+install_query_counter(app)
+
+
 # ==================================================
 # AUTH HELPERS
 # ==================================================
+# identity -> (expires_at, user column values). Users are never updated
+# or deleted by the API, so a short TTL only bounds memory / staleness.
+_USER_CACHE: dict[int, tuple[float, dict]] = {}
+_USER_CACHE_TTL_S = 60.0
+_USER_CACHE_MAX = 10_000
+_USER_CACHE_LOCK = Lock()
+_USER_COLUMNS = [c.key for c in User.__table__.columns]
+
+
+def _cached_user_row(user_id: int) -> dict | None:
+    with _USER_CACHE_LOCK:
+        entry = _USER_CACHE.get(user_id)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del _USER_CACHE[user_id]
+            return None
+        return entry[1]
+
+
+def _store_user_row(user: User) -> None:
+    row = {key: getattr(user, key) for key in _USER_COLUMNS}
+    with _USER_CACHE_LOCK:
+        if len(_USER_CACHE) >= _USER_CACHE_MAX:
+            _USER_CACHE.clear()
+        _USER_CACHE[user.id] = (time.monotonic() + _USER_CACHE_TTL_S, row)
+
+
+def current_user_id() -> int:
+    """
+    Authenticated user's id straight from the JWT (sub = str(user.id)).
+
+    For routes that only scope queries by user: an unknown id simply
+    matches no rows, so no user lookup is needed.
+    """
+    return int(get_jwt_identity())
+
+
 def get_current_user(db: Session) -> User | None:
     identity = get_jwt_identity()
     if not identity:
         return None
-    return db.query(User).filter(User.id == int(identity)).first()
+
+    user_id = int(identity)
+
+    row = _cached_user_row(user_id)
+    if row is not None:
+        # Rebuild a "persistent as loaded" instance and attach it without
+        # a SELECT; relationships (e.g. financial_goals) still lazy-load.
+        user = User(**row)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is not None:
+        _store_user_row(user)
+    return user
 
 
 # ==================================================
@@ -149,20 +356,27 @@ def register():
     if len(password) < 8:
         return {"message": "password must be at least 8 characters"}, 400
 
-    db = SessionLocal()
-    try:
-        if db.query(User).filter(User.email == email).first():
-            return {"message": "email already registered"}, 409
+    user = User(email=email, phone=phone)
+    user.set_password(password)
 
-        user = User(email=email, phone=phone)
-        user.set_password(password)
+    # Single INSERT: the unique email index does the duplicate check
+    db = SessionLocal()
+    created = db.execute(
+        pg_insert(User)
+        .values(
+            email=user.email,
+            phone=user.phone,
+            password_hash=user.password_hash,
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+        .returning(User.id)
+    ).scalar_one_or_none()
+    db.commit()
 
-        db.add(user)
-        db.commit()
+    if created is None:
+        return {"message": "email already registered"}, 409
 
-        return {"status": "success"}
-    finally:
-        db.close()
+    return {"status": "success"}
 
 
 @app.route("/api/auth/login", methods=["POST"])
@@ -176,25 +390,22 @@ def login():
         return {"message": "email and password required"}, 400
 
     db = SessionLocal()
-    try:
-        user = db.query(User).filter(User.email == email).first()
+    user = db.query(User).filter(User.email == email).first()
 
-        if not user or not user.check_password(password):
-            return {"message": "invalid credentials"}, 401
+    if not user or not user.check_password(password):
+        return {"message": "invalid credentials"}, 401
 
-        token = create_access_token(identity=str(user.id))
+    token = create_access_token(identity=str(user.id))
 
 
-        return {
-            "status": "success",
-            "access_token": token,
-            "user": {
-                "id": user.id,
-                "email": user.email,
-            }
+    return {
+        "status": "success",
+        "access_token": token,
+        "user": {
+            "id": user.id,
+            "email": user.email,
         }
-    finally:
-        db.close()
+    }
 
 # ==================================================
 # STATEMENT UPLOAD
@@ -208,24 +419,113 @@ def parse_statement_route():
 
     file = request.files["file"]
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        file.save(tmp.name)
-        pdf_path = tmp.name
+    # Uploads are capped by MAX_CONTENT_LENGTH, so parse from memory
+    # instead of round-tripping through a temp file on disk.
+    pdf_bytes = file.read()
+    filename = file.filename or "statement.pdf"
 
     db = SessionLocal()
-    try:
-        user = get_current_user(db)
-        if not user:
-            return {"message": "user not found"}, 404
+    user = get_current_user(db)
+    if not user:
+        return {"message": "user not found"}, 404
+
+    # ?async=true: queue the parse and return immediately
+    if request.args.get("async") == "true":
+        job = ParseJob(id=uuid.uuid4().hex, user_id=user.id, status="queued")
+        db.add(job)
+        db.commit()
 
-        result = parse_statement(
-            db=db,
-            pdf_path=pdf_path,
-            user_id=user.id,
+        _PARSE_EXECUTOR.submit(
+            _run_parse_job, job.id, user.id, filename, pdf_bytes
+        )
+        return {"status": "queued", "job_id": job.id}, 202
+
+    result = parse_statement(
+        db=db,
+        pdf_path=filename,
+        user_id=user.id,
+        pdf_bytes=pdf_bytes,
+        executor=_PARSE_PROCESS_POOL,
+    )
+
+    invalidate_user(user.id)
+    return jsonify(result)
+
+
+def _run_parse_job(job_id: str, user_id: int, filename: str, pdf_bytes):
+    """
+    Background parse; runs on a _PARSE_EXECUTOR thread with its own
+    thread-scoped session.
+    """
+    db = SessionLocal()
+    try:
+        db.query(ParseJob).filter(ParseJob.id == job_id).update(
+            {"status": "running"}
         )
-        return jsonify(result)
+        db.commit()
+
+        try:
+            result = parse_statement(
+                db=db,
+                pdf_path=filename,
+                user_id=user_id,
+                pdf_bytes=pdf_bytes,
+                executor=_PARSE_PROCESS_POOL,
+            )
+            status = "success" if result.get("status") == "success" else "error"
+        except Exception as e:
+            db.rollback()
+            print("❌ Parse job failed:", job_id, e)
+            result = {"status": "error", "message": str(e)}
+            status = "error"
+
+        # Round-trip through JSON so the trace fits the JSON column
+        db.query(ParseJob).filter(ParseJob.id == job_id).update({
+            "status": status,
+            "result": json_loads(app.json.dumps(result)),
+            "finished_at": datetime.utcnow(),
+        })
+        db.commit()
+
+        invalidate_user(user_id)
     finally:
-        db.close()
+        SessionLocal.remove()
+
+
+@app.route("/api/statement/parse/<job_id>", methods=["GET"])
+@jwt_required()
+def parse_job_status(job_id):
+    db = SessionLocal()
+    user_id = current_user_id()
+
+    job = db.query(
+        ParseJob.status,
+        ParseJob.result,
+        ParseJob.created_at,
+    ).filter(
+        ParseJob.id == job_id,
+        ParseJob.user_id == user_id,
+    ).first()
+
+    if not job:
+        return {"message": "job not found"}, 404
+
+    # Unfinished past the timeout: its worker is gone (see _PARSE_EXECUTOR)
+    if (
+        job.status in ("queued", "running")
+        and job.created_at
+        < datetime.utcnow() - timedelta(seconds=parse_job_timeout_s)
+    ):
+        return {
+            "job_id": job_id,
+            "status": "error",
+            "result": {
+                "status": "error",
+                "message": "Parse job was lost or timed out; upload the statement again.",
+            },
+        }
+
+    return {"job_id": job_id, "status": job.status, "result": job.result}
 
 # ==================================================
 # ANALYTICS
@@ -282,32 +582,85 @@ def analytics_route():
     )
 
     db = SessionLocal()
-    try:
-        # --------------------------------------------------
-        # Auth (JWT → DB user)
-        # --------------------------------------------------
-        user_id = get_jwt_identity()
-        if not user_id:
-            return jsonify({"message": "invalid token"}), 401
-
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            return jsonify({"message": "user not found"}), 404
-
-        # --------------------------------------------------
-        # Analytics (single source of truth)
-        # --------------------------------------------------
-        result = compute_analytics(
-            db=db,
-            user_id=user.id,
-            start_date=start_date,
-            end_date=end_date,
-        )
+    # --------------------------------------------------
+    # Auth (JWT → DB user)
+    # --------------------------------------------------
+    if not get_jwt_identity():
+        return jsonify({"message": "invalid token"}), 401
+
+    user = get_current_user(db)
+    if not user:
+        return jsonify({"message": "user not found"}), 404
+
+    cache_key = analytics_key(user.id, month, period)
+    cached = get_cached(cache_key)
+    if cached is not None:
+        return jsonify(cached)
+
+    # --------------------------------------------------
+    # Analytics (single source of truth)
+    # --------------------------------------------------
+    result = compute_analytics(
+        db=db,
+        user_id=user.id,
+        start_date=start_date,
+        end_date=end_date,
+    )
 
-        return jsonify(result)
+    set_cached(cache_key, result)
+    return jsonify(result)
 
-    finally:
-        db.close()
+
+@app.route("/api/statement/analytics/summary", methods=["GET"])
+@jwt_required()
+def analytics_summary_route():
+    """
+    KPI-only analytics (totals + monthly cashflow).
+
+    Aggregated in SQL, so no transaction rows are loaded; use
+    /api/statement/analytics when categories / debits are needed.
+    """
+    start_date, end_date = _resolve_analytics_window(
+        month=request.args.get("month"),
+        period=request.args.get("period"),
+    )
+
+    db = SessionLocal()
+    user = get_current_user(db)
+    if not user:
+        return jsonify({"message": "user not found"}), 404
+
+    metrics = compute_summary_metrics(
+        db,
+        user.id,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    if metrics is None:
+        return jsonify({
+            "status": "no_data",
+            "message": "No transactions found for this period.",
+            "metrics": None,
+        })
+
+    return jsonify({"status": "success", "metrics": metrics})
+
+
+_RESET_CATEGORIES_SQL = text("""
+    UPDATE transactions
+    SET
+        category = NULL,
+        category_confidence = NULL,
+        category_source = NULL
+    WHERE id IN (
+        SELECT t.id
+        FROM transactions t
+        JOIN statements s ON t.statement_id = s.id
+        WHERE s.user_id = :user_id
+          AND (t.category_source IS NULL OR t.category_source != 'user')
+    )
+""").bindparams(bindparam("user_id", Integer))
 
 
 @app.route("/api/statement/analytics/rerun", methods=["POST"])
@@ -326,52 +679,36 @@ def analytics_rerun_route():
     )
 
     db = SessionLocal()
-    try:
-        user = get_current_user(db)
-        if not user:
-            return {"message": "user not found"}, 404
-
-        # Reset non-user categories for a clean reprocess
-        db.execute(text("""
-            UPDATE transactions
-            SET
-                category = NULL,
-                category_confidence = NULL,
-                category_source = NULL
-            WHERE id IN (
-                SELECT t.id
-                FROM transactions t
-                JOIN statements s ON t.statement_id = s.id
-                WHERE s.user_id = :user_id
-                  AND (t.category_source IS NULL OR t.category_source != 'user')
-            )
-        """), {"user_id": user.id})
-
-        db.commit()
+    user = get_current_user(db)
+    if not user:
+        return {"message": "user not found"}, 404
+
+    # Reset non-user categories for a clean reprocess
+    db.execute(_RESET_CATEGORIES_SQL, {"user_id": user.id})
+
+    db.commit()
+    invalidate_user(user.id)
+
+    # Rebuild categories across the full dataset
+    all_time_result = compute_analytics(
+        db=db,
+        user_id=user.id,
+        start_date=None,
+        end_date=None,
+    )
 
-        # Rebuild categories across the full dataset
-        all_time_result = compute_analytics(
+    if start_date or end_date:
+        result = compute_analytics(
             db=db,
             user_id=user.id,
-            start_date=None,
-            end_date=None,
+            start_date=start_date,
+            end_date=end_date,
         )
+    else:
+        result = all_time_result
 
-        if start_date or end_date:
-            result = compute_analytics(
-                db=db,
-                user_id=user.id,
-                start_date=start_date,
-                end_date=end_date,
-            )
-        else:
-            result = all_time_result
-
-        result["llm_status"] = check_llm_health()
-        return jsonify(result)
-
-    finally:
-        db.close()
+    result["llm_status"] = check_llm_health()
+    return jsonify(result)
 
 
 # ==================================================
@@ -383,19 +720,24 @@ def insights_route():
     force_refresh = request.args.get("force_refresh") == "true"
 
     db = SessionLocal()
-    try:
-        user = get_current_user(db)
-        if not user:
-            return {"message": "user not found"}, 404
+    user = get_current_user(db)
+    if not user:
+        return {"message": "user not found"}, 404
+
+    cache_key = insights_key(user.id)
+    if not force_refresh:
+        cached = get_cached(cache_key)
+        if cached is not None:
+            return jsonify(cached)
+
+    result = generate_insights_view(
+        db=db,
+        user_id=user.id,
+        force_refresh=force_refresh,
+    )
 
-        result = generate_insights_view(
-            db=db,
-            user_id=user.id,
-            force_refresh=force_refresh,
-        )
-        return jsonify(result)
-    finally:
-        db.close()
+    set_cached(cache_key, result)
+    return jsonify(result)
 
 
 @app.route("/api/statement/insights/history", methods=["GET"])
@@ -408,35 +750,30 @@ def insights_history_route():
         limit = 12
 
     db = SessionLocal()
-    try:
-        user = get_current_user(db)
-        if not user:
-            return {"message": "user not found"}, 404
-
-        snapshots = (
-            db.query(InsightSnapshot)
-            .filter(InsightSnapshot.user_id == user.id)
-            .order_by(InsightSnapshot.snapshot_month.desc())
-            .limit(limit)
-            .all()
-        )
+    user_id = current_user_id()
+
+    snapshots = (
+        db.query(InsightSnapshot)
+        .filter(InsightSnapshot.user_id == user_id)
+        .order_by(InsightSnapshot.snapshot_month.desc())
+        .limit(limit)
+        .all()
+    )
 
-        return {
-            "status": "success",
-            "snapshots": [
-                {
-                    "month": s.snapshot_month.isoformat(),
-                    "created_at": s.created_at.isoformat(),
-                    "financial_summary": s.financial_summary,
-                    "category_insights": s.category_insights,
-                    "transaction_patterns": s.transaction_patterns,
-                    "metrics": s.metrics,
-                }
-                for s in snapshots
-            ],
-        }
-    finally:
-        db.close()
+    return {
+        "status": "success",
+        "snapshots": [
+            {
+                "month": s.snapshot_month,
+                "created_at": s.created_at,
+                "financial_summary": s.financial_summary,
+                "category_insights": s.category_insights,
+                "transaction_patterns": s.transaction_patterns,
+                "metrics": s.metrics,
+            }
+            for s in snapshots
+        ],
+    }
 
 # ==================================================
 # AGENT RECOMMENDATIONS
@@ -447,78 +784,126 @@ def agent_route():
     data = request.get_json(silent=True) or {}
 
     db = SessionLocal()
-    try:
-        user = get_current_user(db)
-        if not user:
-            return {"message": "user not found"}, 404
-
-        raw_goals = data.get("goals")
-
-        if raw_goals:
-            goals = parse_user_goals(raw_goals)
-        else:
-            goals = [
-                FinancialGoal(
-                    name=g.name,
-                    target_amount=g.target_amount,
-                    deadline=g.deadline,
-                    priority=g.priority,
-                )
-                for g in user.financial_goals
-                if g.is_active
-            ]
+    # Goals / transactions are scoped by the JWT identity directly; whether
+    # the user exists is only checked when nothing was found (see below)
+    user_id = current_user_id()
 
-        result = run_agent_view(
-            db=db,
-            user_id=user.id,
-            goals=goals,
-        )
-        return jsonify(result)
-    finally:
-        db.close()
+    raw_goals = data.get("goals")
+
+    if raw_goals:
+        goals = parse_user_goals(raw_goals)
+    else:
+        # Only active goals, in one indexed query (ix_goal_user_created_active).
+        # The projected rows already expose name / target_amount / deadline /
+        # priority like parse_user_goals' objects, so they are passed as-is.
+        goals = db.query(
+            FinancialGoal.name,
+            FinancialGoal.target_amount,
+            FinancialGoal.deadline,
+            FinancialGoal.priority,
+        ).filter(
+            FinancialGoal.user_id == user_id,
+            FinancialGoal.is_active,
+        ).all()
+
+    result = run_agent_view(
+        db=db,
+        user_id=user_id,
+        goals=goals,
+    )
+
+    if (
+        result.get("status") == "no_data"
+        and db.query(User.id).filter(User.id == user_id).scalar() is None
+    ):
+        return {"message": "user not found"}, 404
+
+    return jsonify(result)
 
 # ==================================================
 # GOALS API
 # ==================================================
+# Built once: the per-request cost is just binding user_id.
+# Column projection → plain Row tuples, no ORM instance hydration.
+_GOALS_LIST_SQL = (
+    select(
+        FinancialGoal.id,
+        FinancialGoal.name,
+        FinancialGoal.target_amount,
+        FinancialGoal.deadline,
+        FinancialGoal.priority,
+    )
+    .where(
+        FinancialGoal.user_id == bindparam("user_id", type_=Integer),
+        FinancialGoal.is_active,
+    )
+    .order_by(FinancialGoal.created_at.desc())
+)
+
+
 @app.route("/api/goals", methods=["GET"])
 @jwt_required()
 def get_goals():
     db = SessionLocal()
-    try:
-        user = get_current_user(db)
-        if not user:
-            return {"message": "user not found"}, 404
-
-        goals = (
-            db.query(FinancialGoal)
-            .filter(
-                FinancialGoal.user_id == user.id,
-                FinancialGoal.is_active.is_(True),
-            )
-            .order_by(FinancialGoal.created_at.desc())
-            .all()
+    rows = db.execute(_GOALS_LIST_SQL, {"user_id": current_user_id()})
+
+    return {
+        "status": "success",
+        "goals": [
+            {
+                "id": goal_id,
+                "name": name,
+                "target_amount": target_amount,
+                "deadline": deadline,
+                "priority": priority,
+            }
+            for goal_id, name, target_amount, deadline, priority in rows
+        ],
+    }
+
+
+# False once this process has seen a database without
+# ux_goal_user_name_active (created before it; fixed by init_db.py)
+_GOAL_UPSERT_SUPPORTED = True
+
+
+def _insert_new_goals_prechecked(db: Session, user_id: int, goals, now) -> int:
+    """
+    create_goals without the partial unique index: one IN query for the
+    names already active, then a plain insert of the rest.
+    """
+    existing = {
+        name
+        for (name,) in db.query(FinancialGoal.name).filter(
+            FinancialGoal.user_id == user_id,
+            FinancialGoal.name.in_({g.name for g in goals}),
+            FinancialGoal.is_active,
         )
+    }
+
+    new_goals = [
+        FinancialGoal(
+            user_id=user_id,
+            name=g.name,
+            target_amount=g.target_amount,
+            deadline=g.deadline,
+            priority=g.priority,
+            is_active=True,
+            created_at=now,
+        )
+        for g in goals
+        if g.name not in existing
+    ]
 
-        return {
-            "status": "success",
-            "goals": [
-                {
-                    "id": g.id,
-                    "name": g.name,
-                    "target_amount": g.target_amount,
-                    "deadline": g.deadline.isoformat(),
-                    "priority": g.priority,
-                }
-                for g in goals
-            ],
-        }
-    finally:
-        db.close()
+    db.add_all(new_goals)
+    return len(new_goals)
 
 
 @app.route("/api/goals", methods=["POST"])
 @jwt_required()
 def create_goals():
+    global _GOAL_UPSERT_SUPPORTED
+
     data = request.get_json(silent=True) or {}
     raw_goals = data.get("goals")
 
@@ -526,154 +911,315 @@ def create_goals():
         return {"message": "goals list required"}, 400
 
     db = SessionLocal()
-    try:
-        user = get_current_user(db)
-        if not user:
-            return {"message": "user not found"}, 404
-
-        parsed = parse_user_goals(raw_goals)
-
-        for g in parsed:
-            exists = db.query(FinancialGoal).filter(
-                FinancialGoal.user_id == user.id,
-                FinancialGoal.name == g.name,
-                FinancialGoal.is_active.is_(True),
-            ).first()
-
-            if not exists:
-                db.add(FinancialGoal(
-                    user_id=user.id,
-                    name=g.name,
-                    target_amount=g.target_amount,
-                    deadline=g.deadline,
-                    priority=g.priority,
-                ))
+    user = get_current_user(db)
+    if not user:
+        return {"message": "user not found"}, 404
+
+    # First goal wins for names repeated within the request (same rule as
+    # ON CONFLICT DO NOTHING), so duplicates never reach the INSERT
+    parsed = {}
+    for g in parse_user_goals(raw_goals):
+        parsed.setdefault(g.name, g)
+
+    user_id = user.id
+    now = datetime.utcnow()
+
+    saved = 0
+    if parsed and not _GOAL_UPSERT_SUPPORTED:
+        saved = _insert_new_goals_prechecked(db, user_id, parsed.values(), now)
+        db.commit()
 
+    elif parsed:
+        # Names already active for the user are skipped by the partial
+        # unique index (ux_goal_user_name_active): no pre-check query
+        try:
+            result = db.execute(
+                pg_insert(FinancialGoal)
+                .values([
+                    {
+                        "user_id": user_id,
+                        "name": g.name,
+                        "target_amount": g.target_amount,
+                        "deadline": g.deadline,
+                        "priority": g.priority,
+                        "is_active": True,
+                        "created_at": now,
+                    }
+                    for g in parsed.values()
+                ])
+                .on_conflict_do_nothing(
+                    index_elements=[FinancialGoal.user_id, FinancialGoal.name],
+                    index_where=FinancialGoal.is_active,
+                )
+                .returning(FinancialGoal.id)
+            )
+            saved = len(result.all())
+        except ProgrammingError:
+            # No matching unique index: database predates it
+            db.rollback()
+            _GOAL_UPSERT_SUPPORTED = False
+            print(
+                "⚠️ ux_goal_user_name_active missing; "
+                "run init_db.py. Using the pre-check insert."
+            )
+            saved = _insert_new_goals_prechecked(
+                db, user_id, parsed.values(), now
+            )
         db.commit()
-        return {"status": "success"}
-    finally:
-        db.close()
+
+    return {"status": "success", "saved": saved}
 
 
 @app.route("/api/goals/<int:goal_id>", methods=["DELETE"])
 @jwt_required()
 def delete_goal(goal_id):
     db = SessionLocal()
-    try:
-        user = get_current_user(db)
-        if not user:
-            return {"message": "user not found"}, 404
+    user_id = current_user_id()
 
-        goal = db.query(FinancialGoal).filter(
+    # Ownership + existence check folded into the UPDATE (no SELECT first)
+    result = db.execute(
+        update(FinancialGoal)
+        .where(
             FinancialGoal.id == goal_id,
-            FinancialGoal.user_id == user.id,
-            FinancialGoal.is_active.is_(True),
-        ).first()
+            FinancialGoal.user_id == user_id,
+            FinancialGoal.is_active,
+        )
+        .values(is_active=False),
+        # Nothing is loaded in this session: skip identity-map sync
+        execution_options={"synchronize_session": False},
+    )
 
-        if not goal:
-            return {"message": "goal not found"}, 404
+    if not result.rowcount:
+        db.rollback()
+        return {"message": "goal not found"}, 404
 
-        goal.is_active = False
-        db.commit()
-        return {"status": "success"}
-    finally:
-        db.close()
+    db.commit()
+    return {"status": "success"}
 
 # ==================================================
 # TRANSACTIONS (WITH CONFIDENCE)
 # ==================================================
+TRANSACTIONS_PAGE_DEFAULT = 200
+TRANSACTIONS_PAGE_MAX = 500
+TRANSACTIONS_STREAM_BATCH = 500
+
+
+def _tx_list_sql(seek: bool, page: bool):
+    params = [bindparam("user_id", Integer)]
+    if seek:
+        params += [
+            bindparam("cursor_date", Date),
+            bindparam("cursor_id", Integer),
+        ]
+    if page:
+        params.append(bindparam("limit", Integer))
+
+    return text(f"""
+        SELECT
+            t.id,
+            t.date,
+            t.description,
+            t.merchant,
+            t.amount,
+            t.category,
+            t.category_confidence,
+            t.category_source
+        FROM transactions t
+        JOIN statements s ON t.statement_id = s.id
+        WHERE s.user_id = :user_id
+        {"AND (t.date, t.id) < (:cursor_date, :cursor_id)" if seek else ""}
+        ORDER BY t.date DESC, t.id DESC
+        {"LIMIT :limit" if page else ""}
+    """).bindparams(*params)
+
+
+# Built once at import, keyed by (has cursor, has limit)
+_TX_LIST_SQL = {
+    (seek, page): _tx_list_sql(seek, page)
+    for seek in (False, True)
+    for page in (False, True)
+}
+
+
+def _encode_tx_cursor(row) -> str:
+    raw = f"{row.date}|{row.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_tx_cursor(cursor: str):
+    raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    date_part, id_part = raw.split("|", 1)
+    return datetime.strptime(date_part, "%Y-%m-%d").date(), int(id_part)
+
+
 @app.route("/api/transactions", methods=["GET"])
 @jwt_required()
 def get_transactions():
+    """
+    Transactions, newest first.
+
+    Without ?limit the full list is returned (dashboard). With
+    ?limit=N (max 500) results are keyset-paginated: pass the returned
+    next_cursor back as ?cursor= to fetch the following page.
+    """
+    limit = request.args.get("limit", type=int)
+    cursor = request.args.get("cursor")
+
+    if cursor is not None and limit is None:
+        limit = TRANSACTIONS_PAGE_DEFAULT
+
+    params = {}
+
+    if limit is not None:
+        params["limit"] = max(1, min(limit, TRANSACTIONS_PAGE_MAX)) + 1
+
+    if cursor:
+        try:
+            params["cursor_date"], params["cursor_id"] = (
+                _decode_tx_cursor(cursor)
+            )
+        except (ValueError, binascii.Error):
+            return {"message": "invalid cursor"}, 400
+
     db = SessionLocal()
-    try:
-        user = get_current_user(db)
-        if not user:
-            return {"message": "user not found"}, 404
-
-        rows = db.execute(text("""
-            SELECT
-                t.id,
-                t.date,
-                t.description,
-                t.merchant,
-                t.amount,
-                t.category,
-                t.category_confidence,
-                t.category_source
-            FROM transactions t
-            JOIN statements s ON t.statement_id = s.id
-            WHERE s.user_id = :user_id
-            ORDER BY t.date DESC
-        """), {"user_id": user.id}).fetchall()
+    params["user_id"] = current_user_id()
+
+    sql = _TX_LIST_SQL[(bool(cursor), limit is not None)]
+    if limit is None:
+        # Full list: stream rows from a server-side cursor straight into
+        # the response body instead of materializing list + JSON.
+        return Response(
+            _stream_transactions(sql, params),
+            mimetype="application/json",
+        )
+
+    rows = db.execute(sql, params).fetchall()
+
+    # One extra row was fetched to know whether another page exists
+    next_cursor = None
+    if limit is not None and len(rows) == params["limit"]:
+        rows = rows[:-1]
+        next_cursor = _encode_tx_cursor(rows[-1])
+
+    return {
+        "transactions": [_transaction_json(r) for r in rows],
+        "next_cursor": next_cursor,
+    }
+
+
+def _transaction_json(r) -> dict:
+    return {
+        "id": r.id,
+        "date": r.date,
+        "description": r.description,
+        "merchant": r.merchant or r.description,
+        "amount": r.amount,
+        "category": r.category,
+        "confidence": float(r.category_confidence or 1.0),
+        "needs_review": (r.category_confidence or 1.0) < 0.70,
+        "source": r.category_source,
+    }
+
+
+def _stream_transactions(sql, params):
+    # The request session is torn down before the body is sent, so the
+    # generator checks out its own connection for the cursor's lifetime.
+    with engine.connect() as conn:
+        result = conn.execution_options(
+            stream_results=True,
+            yield_per=TRANSACTIONS_STREAM_BATCH,
+        ).execute(sql, params)
+
+        yield b'{"transactions":['
+
+        first = True
+        for r in result:
+            yield (b"" if first else b",") + json_bytes(_transaction_json(r))
+            first = False
+
+        yield b"]}"
+
 
-        return {
-            "transactions": [
-                {
-                    "id": r.id,
-                    "date": r.date.isoformat(),
-                    "description": r.description,
-                    "merchant": r.merchant or r.description,
-                    "amount": float(r.amount),
-                    "category": r.category,
-                    "confidence": float(r.category_confidence or 1.0),
-                    "needs_review": (r.category_confidence or 1.0) < 0.70,
-                    "source": r.category_source,
-                }
-                for r in rows
-            ]
-        }
-    finally:
-        db.close()
 # ==================================================
 # TRANSACTION EXPLAINABILITY
 # ==================================================
+_EXPLAIN_TX_SQL = text("""
+    SELECT
+        t.id,
+        t.date,
+        t.description,
+        t.merchant,
+        t.category,
+        t.category_confidence,
+        t.category_source,
+        t.raw
+    FROM transactions t
+    JOIN statements s ON t.statement_id = s.id
+    WHERE t.id = :tx_id
+      AND s.user_id = :user_id
+""").bindparams(
+    bindparam("tx_id", Integer),
+    bindparam("user_id", Integer),
+)
+
+
 @app.route("/api/transaction/explain/<int:tx_id>", methods=["GET"])
 @jwt_required()
 def explain_transaction(tx_id):
     db = SessionLocal()
-    try:
-        user = get_current_user(db)
-        if not user:
-            return {"message": "user not found"}, 404
-
-        row = db.execute(text("""
-            SELECT
-                t.id,
-                t.date,
-                t.description,
-                t.merchant,
-                t.category,
-                t.category_confidence,
-                t.category_source,
-                t.raw
-            FROM transactions t
-            JOIN statements s ON t.statement_id = s.id
-            WHERE t.id = :tx_id
-              AND s.user_id = :user_id
-        """), {
-            "tx_id": tx_id,
-            "user_id": user.id
-        }).fetchone()
-
-        if not row:
-            return {"message": "transaction not found"}, 404
-
-        return {
-            "transaction_id": row.id,
-            "merchant": row.merchant or row.description,
-            "category": row.category,
-            "confidence": float(row.category_confidence or 1.0),
-            "source": row.category_source,
-            "decision_metadata": row.raw or {},
-        }
-    finally:
-        db.close()
-from analytics.merchant_memory import save_merchant_category
+    user_id = current_user_id()
+
+    row = db.execute(_EXPLAIN_TX_SQL, {
+        "tx_id": tx_id,
+        "user_id": user_id
+    }).fetchone()
+
+    if not row:
+        return {"message": "transaction not found"}, 404
+
+    return {
+        "transaction_id": row.id,
+        "merchant": row.merchant or row.description,
+        "category": row.category,
+        "confidence": float(row.category_confidence or 1.0),
+        "source": row.category_source,
+        "decision_metadata": row.raw or {},
+    }
+from analytics.merchant_memory import (
+    save_merchant_category,
+    save_merchant_categories,
+)
 
 # ==================================================
 # MANUAL TRANSACTION CORRECTION
 # ==================================================
+# The CTE snapshot still holds the pre-update merchant, which is
+# RETURNed for the merchant memory.
+_CORRECT_TX_SQL = text("""
+    WITH old AS (
+        SELECT t.id, t.merchant
+        FROM transactions t
+        JOIN statements s ON t.statement_id = s.id
+        WHERE t.id = :tx_id
+          AND s.user_id = :user_id
+    )
+    UPDATE transactions AS t
+    SET
+        merchant = :merchant,
+        category = :category,
+        category_confidence = 1.0,
+        category_source = 'user'
+    FROM old
+    WHERE t.id = old.id
+    RETURNING old.merchant
+""").bindparams(
+    bindparam("merchant", String),
+    bindparam("category", String),
+    bindparam("tx_id", Integer),
+    bindparam("user_id", Integer),
+)
+
+
 @app.route("/api/transaction/correct", methods=["POST"])
 @jwt_required()
 def correct_transaction():
@@ -688,62 +1234,160 @@ def correct_transaction():
         return {"message": "missing required fields"}, 400
 
     db = SessionLocal()
-    try:
-        user = get_current_user(db)
-        if not user:
-            return {"message": "user not found"}, 404
-
-        tx = db.execute(text("""
-            SELECT t.id, t.merchant
-            FROM transactions t
-            JOIN statements s ON t.statement_id = s.id
-            WHERE t.id = :tx_id
-              AND s.user_id = :user_id
-        """), {
-            "tx_id": tx_id,
-            "user_id": user.id
-        }).fetchone()
-
-        if not tx:
-            return {"message": "transaction not found"}, 404
-
-        db.execute(text("""
-            UPDATE transactions
-            SET
-                merchant = :merchant,
-                category = :category,
-                category_confidence = 1.0,
-                category_source = 'user'
-            WHERE id = :tx_id
-        """), {
-            "merchant": merchant,
-            "category": category,
-            "tx_id": tx_id,
-        })
+    user_id = current_user_id()
+
+    # Ownership check + update in one statement (_CORRECT_TX_SQL)
+    tx = db.execute(_CORRECT_TX_SQL, {
+        "merchant": merchant,
+        "category": category,
+        "tx_id": tx_id,
+        "user_id": user_id,
+    }).fetchone()
+
+    if not tx:
+        return {"message": "transaction not found"}, 404
+
+    if remember:
+        save_merchant_category(
+            merchant=tx.merchant,
+            category=category,
+            confidence=1.0
+        )
 
-        if remember:
-            save_merchant_category(
-                merchant=tx.merchant,
-                category=category,
-                confidence=1.0
-            )
+    db.commit()
+    invalidate_user(user_id)
+    return {"status": "success"}
 
-        db.commit()
-        return {"status": "success"}
-    finally:
-        db.close()
+@app.route("/api/transactions/correct_bulk", methods=["POST"])
+@jwt_required()
+def correct_transactions_bulk():
+    """
+    Apply many corrections at once:
+    {"corrections": [{transaction_id, merchant, category, remember?}]}
+
+    One ownership SELECT + one UPDATE ... FROM (VALUES ...) regardless
+    of how many rows are corrected.
+    """
+    data = request.get_json(silent=True) or {}
+    raw = data.get("corrections")
+
+    if not isinstance(raw, list) or not raw:
+        return {"message": "corrections list required"}, 400
+
+    corrections = {}
+    for c in raw:
+        if not isinstance(c, dict):
+            return {"message": "missing required fields"}, 400
+
+        tx_id = c.get("transaction_id")
+        merchant = c.get("merchant_normalized") or c.get("merchant")
+        category = c.get("category")
+
+        # JSON true / false are ints in Python: {"transaction_id": true}
+        # must not correct transaction 1
+        if (
+            not isinstance(tx_id, int)
+            or isinstance(tx_id, bool)
+            or not merchant
+            or not category
+        ):
+            return {"message": "missing required fields"}, 400
+
+        # Last correction for a transaction wins
+        corrections[tx_id] = (merchant, category, bool(c.get("remember")))
+
+    db = SessionLocal()
+    user_id = current_user_id()
+
+    owned = dict(
+        db.query(Transaction.id, Transaction.merchant)
+        .join(Statement)
+        .filter(
+            Statement.user_id == user_id,
+            Transaction.id.in_(corrections),
+        )
+        .all()
+    )
+
+    missing = sorted(set(corrections) - set(owned))
+    if missing:
+        return {
+            "message": "transaction not found",
+            "transaction_ids": missing,
+        }, 404
+
+    v = values(
+        column("id", Integer),
+        column("merchant", String),
+        column("category", String),
+        name="v",
+    ).data([
+        (tx_id, merchant, category)
+        for tx_id, (merchant, category, _) in corrections.items()
+    ])
+
+    db.execute(
+        update(Transaction)
+        .where(Transaction.id == v.c.id)
+        .values(
+            merchant=v.c.merchant,
+            category=v.c.category,
+            category_confidence=1.0,
+            category_source="user",
+        ),
+        # No Transaction instances are loaded here; without this the ORM
+        # falls back to "fetch" sync (an extra RETURNING of every id)
+        execution_options={"synchronize_session": False},
+    )
+
+    save_merchant_categories(
+        [
+            (owned[tx_id], category)
+            for tx_id, (_, category, remember) in corrections.items()
+            if remember
+        ],
+        confidence=1.0,
+    )
+
+    db.commit()
+    invalidate_user(user_id)
+    return {"status": "success", "updated": len(corrections)}
 
 # ==================================================
 # HEALTH
 # ==================================================
+# Liveness probes fire every few seconds; a recent successful check is
+# reused instead of a pool checkout + SELECT 1 on every probe.
+# Failures are never cached, so recovery is seen on the next probe.
+_DB_HEALTH_TTL_S = 5.0
+_DB_HEALTH_TIMEOUT_MS = 500
+_DB_HEALTH_LOCK = Lock()
+_db_health_ok_until = 0.0
+
+
 @app.route("/health/db")
 def db_health():
-    try:
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+    global _db_health_ok_until
+
+    if time.monotonic() < _db_health_ok_until:
         return {"db": "connected"}
-    except Exception as e:
-        return {"db": "error", "detail": str(e)}, 500
+
+    # One probe at a time re-checks; concurrent ones wait for its result
+    with _DB_HEALTH_LOCK:
+        if time.monotonic() < _db_health_ok_until:
+            return {"db": "connected"}
+
+        try:
+            with engine.connect() as conn:
+                conn.exec_driver_sql(
+                    f"SET LOCAL statement_timeout = {_DB_HEALTH_TIMEOUT_MS}"
+                )
+                conn.execute(text("SELECT 1"))
+            _db_health_ok_until = time.monotonic() + _DB_HEALTH_TTL_S
+            return {"db": "connected"}
+        except Exception as e:
+            _db_health_ok_until = 0.0
+            return {"db": "error", "detail": str(e)}, 500
 
 # ==================================================
 # RUN
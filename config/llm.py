@@ -13,6 +13,32 @@ OLLAMA_URL = os.getenv(
     "http://localhost:11434/api/generate"
 )
 
+# Server-side concurrency. Ollama serializes requests unless the server is
+# started with OLLAMA_NUM_PARALLEL > 1; client batch paths never run more
+# concurrent calls than this value.
+try:
+    OLLAMA_NUM_PARALLEL = max(1, int(os.getenv("OLLAMA_NUM_PARALLEL", "1")))
+except ValueError:
+    OLLAMA_NUM_PARALLEL = 1
+
+# Max in-flight LLM calls per process (adapter semaphore). Defaults to the
+# Ollama server's parallelism; remote OpenAI-compatible APIs allow more.
+try:
+    LLM_CONCURRENCY = max(1, int(os.getenv(
+        "LLM_CONCURRENCY",
+        str(OLLAMA_NUM_PARALLEL if LLM_PROVIDER == "ollama" else 4),
+    )))
+except ValueError:
+    LLM_CONCURRENCY = 1
+
+# Merchants classified per categorization prompt. 1 = one prompt per
+# merchant; larger values pay the system prompt + category list once per
+# batch (fewer, longer calls on a serial server).
+try:
+    LLM_CATEGORIZE_BATCH = max(1, int(os.getenv("LLM_CATEGORIZE_BATCH", "1")))
+except ValueError:
+    LLM_CATEGORIZE_BATCH = 1
+
 # Model name
 LLM_MODEL = os.getenv(
     "LLM_MODEL",
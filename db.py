@@ -1,16 +1,111 @@
 import os
-from sqlalchemy import create_engine
+import threading
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, scoped_session
 
+try:
+    import psycopg  # noqa: F401  (psycopg 3: binary protocol, pipelined batches)
+    PG_DRIVER = "psycopg"
+except ImportError:  # optional: fall back to psycopg2
+    PG_DRIVER = "psycopg2"
+
 DATABASE_URL = os.getenv(
     "DATABASE_URL",
-    "postgresql+psycopg2://finance_user@localhost:5432/finance_agent",
+    f"postgresql+{PG_DRIVER}://finance_user@localhost:5432/finance_agent",
+)
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+# Per process: one session per gunicorn request thread (GUNICORN_THREADS)
+# plus one per PARSE_WORKERS background parse (same defaults as
+# gunicorn.conf.py / app.py), and a small burst overflow. Every worker
+# gets its own pool, so 2 workers x (18 + 10) stays well under Postgres's
+# default max_connections=100. Recycle before server/firewall idle
+# timeouts drop the connection.
+DB_POOL_SIZE = _env_int(
+    "DB_POOL_SIZE",
+    _env_int("GUNICORN_THREADS", 16) + max(1, _env_int("PARSE_WORKERS", 2)),
 )
+DB_MAX_OVERFLOW = _env_int("DB_MAX_OVERFLOW", 10)
+DB_POOL_RECYCLE = _env_int("DB_POOL_RECYCLE", 3600)
+DB_POOL_TIMEOUT = _env_int("DB_POOL_TIMEOUT", 30)
+
+# psycopg 3 only: server-side prepare a statement after it has run this
+# many times on a connection (the hot routes reuse a handful of fixed
+# statements). Set DB_PREPARE_THRESHOLD=-1 behind pgbouncer in
+# transaction mode, which cannot keep prepared statements.
+DB_PREPARE_THRESHOLD = _env_int("DB_PREPARE_THRESHOLD", 3)
+
+connect_args = {}
+if make_url(DATABASE_URL).drivername == "postgresql+psycopg":
+    connect_args["prepare_threshold"] = (
+        DB_PREPARE_THRESHOLD if DB_PREPARE_THRESHOLD >= 0 else None
+    )
+
 engine = create_engine(
     DATABASE_URL,
+    connect_args=connect_args,
     pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_timeout=DB_POOL_TIMEOUT,
 )
 
+# expire_on_commit=False: sessions are request-scoped, so reading e.g.
+# statement.id / user.id after commit must not cost a reload SELECT.
 SessionLocal = scoped_session(
-    sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=engine,
+    )
 )
+
+
+# ==================================================
+# PER-REQUEST QUERY COUNTER (DEBUG, OPT-IN)
+# ==================================================
+# QUERY_COUNT_WARN=N prints a warning for any request that executes more
+# than N statements, so a new N+1 loop shows up in the dev log at once.
+# Unset / 0 = off: no engine listener is registered at all.
+QUERY_COUNT_WARN = _env_int("QUERY_COUNT_WARN", 0)
+
+_query_count = threading.local()
+
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    if getattr(_query_count, "active", False):
+        _query_count.n += 1
+
+
+def install_query_counter(app, threshold: int = QUERY_COUNT_WARN) -> None:
+    if threshold <= 0:
+        return
+
+    event.listen(engine, "before_cursor_execute", _count_query)
+
+    @app.before_request
+    def _start_query_count():
+        _query_count.n = 0
+        _query_count.active = True
+
+    @app.after_request
+    def _check_query_count(response):
+        from flask import request
+
+        _query_count.active = False
+        if _query_count.n > threshold:
+            print(
+                f"⚠️ {request.method} {request.path}: "
+                f"{_query_count.n} SQL statements (> {threshold})"
+            )
+        return response
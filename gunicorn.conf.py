@@ -0,0 +1,22 @@
+import os
+
+# ==================================================
+# PRODUCTION SERVER (gunicorn app:app)
+# ==================================================
+# The slow endpoints (parse, insights, agent) mostly wait on Ollama HTTP
+# calls and Postgres, which release the GIL. Threaded workers let one
+# process keep many of those requests in flight instead of blocking a
+# whole worker per request. SessionLocal is thread-scoped, so each
+# request thread gets its own DB session.
+bind = os.getenv("GUNICORN_BIND", "127.0.0.1:5000")
+workers = int(os.getenv("GUNICORN_WORKERS", "2"))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "16"))
+
+# Without Redis every worker would hold its own response cache, and an
+# upload / correction on one worker could not invalidate the others'
+if workers > 1 and not os.getenv("REDIS_URL"):
+    os.environ.setdefault("RESPONSE_CACHE_LOCAL", "false")
+
+# PDF parsing + LLM categorization can legitimately take minutes
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "300"))
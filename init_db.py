@@ -1,7 +1,31 @@
 # init_db.py
+from sqlalchemy import text
+
 from db import engine
 from models import Base
 
 if __name__ == "__main__":
     Base.metadata.create_all(bind=engine)
+
+    # ux_goal_user_name_active cannot be built over duplicate active
+    # goal names (allowed before it existed): keep the oldest, deactivate
+    # the rest, as deleting a goal does
+    with engine.begin() as conn:
+        conn.execute(text("""
+            UPDATE financial_goals AS g
+            SET is_active = false
+            FROM financial_goals AS k
+            WHERE k.user_id = g.user_id
+              AND k.name = g.name
+              AND k.is_active
+              AND g.is_active
+              AND k.id < g.id
+        """))
+
+    # create_all skips indexes of tables that already exist;
+    # add any new ones so existing databases pick them up.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
     print("✅ Tables created")
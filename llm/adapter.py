@@ -1,9 +1,16 @@
+import json
 import time
 from datetime import datetime
-from threading import Lock
+from threading import BoundedSemaphore
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json fallback
+    orjson = None
 
 try:
     from config.llm import (
@@ -11,6 +18,7 @@ try:
         LLM_PROVIDER,
         OLLAMA_URL,
         LLM_MODEL,
+        LLM_CONCURRENCY,
         OPENAI_API_KEY,
         OPENAI_BASE_URL,
         OPENAI_ORG,
@@ -22,6 +30,7 @@ except ImportError:
     LLM_PROVIDER = "ollama"
     OLLAMA_URL = "http://localhost:11434/api/generate"
     LLM_MODEL = "llama3"
+    LLM_CONCURRENCY = 1
     OPENAI_API_KEY = None
     OPENAI_BASE_URL = "https://api.openai.com/v1"
     OPENAI_ORG = None
@@ -30,15 +39,49 @@ except ImportError:
 # ==================================================
 # INTERNAL STATE
 # ==================================================
-_LLM_LOCK = Lock()
+# Caps in-flight calls at LLM_CONCURRENCY (was a single-flight Lock that
+# serialized every LLM call in the process). Held only around the HTTP
+# call itself, never during retry back-off.
+_LLM_SEM = BoundedSemaphore(LLM_CONCURRENCY)
 _LAST_FAILURE_TS = 0.0
 _FAILURE_COOLDOWN = 30  # seconds
 
 
+# ==================================================
+# HTTP (keep-alive)
+# ==================================================
+# One pooled Session for every LLM call: reuses TCP (and TLS for
+# OpenAI-compatible endpoints) connections instead of a new handshake
+# per request. pool_maxsize covers the parallel categorizer workers.
+_HTTP_POOL_MAXSIZE = 32
+
+_HTTP = requests.Session()
+for _prefix in ("http://", "https://"):
+    _HTTP.mount(
+        _prefix,
+        HTTPAdapter(pool_connections=8, pool_maxsize=_HTTP_POOL_MAXSIZE),
+    )
+
+
 def is_llm_enabled() -> bool:
     return bool(LLM_ENABLED)
 
 
+# ==================================================
+# JSON (orjson when available)
+# ==================================================
+def json_loads(data: str | bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
 def _guard_prompt(prompt: str, max_chars: int) -> str:
     if len(prompt) <= max_chars:
         return prompt
@@ -51,23 +94,29 @@ def _call_ollama(
     top_p: float,
     timeout: int,
     model: str,
+    max_tokens: int | None = None,
 ) -> str:
-    response = requests.post(
+    options = {
+        "temperature": float(temperature),
+        "top_p": float(top_p),
+    }
+    if max_tokens is not None:
+        options["num_predict"] = int(max_tokens)
+
+    response = _HTTP.post(
         OLLAMA_URL,
-        json={
+        data=json_dumps({
             "model": model,
             "prompt": prompt,
             "stream": False,
-            "options": {
-                "temperature": float(temperature),
-                "top_p": float(top_p),
-            },
-        },
+            "options": options,
+        }),
+        headers={"Content-Type": "application/json"},
         timeout=timeout,
     )
 
     response.raise_for_status()
-    return response.json().get("response", "")
+    return json_loads(response.content).get("response", "")
 
 
 def _call_openai_compatible(
@@ -76,6 +125,7 @@ def _call_openai_compatible(
     top_p: float,
     timeout: int,
     model: str,
+    max_tokens: int | None = None,
 ) -> str:
     if not OPENAI_API_KEY:
         raise RuntimeError("OPENAI_API_KEY is not set")
@@ -97,16 +147,18 @@ def _call_openai_compatible(
         "temperature": float(temperature),
         "top_p": float(top_p),
     }
+    if max_tokens is not None:
+        payload["max_tokens"] = int(max_tokens)
 
-    response = requests.post(
+    response = _HTTP.post(
         url,
         headers=headers,
-        json=payload,
+        data=json_dumps(payload),
         timeout=timeout,
     )
 
     response.raise_for_status()
-    data = response.json()
+    data = json_loads(response.content)
 
     choices = data.get("choices", [])
     if not choices:
@@ -125,12 +177,16 @@ def generate_text(
     max_prompt_chars: int = 12_000,
     return_none_on_fail: bool = False,
     model: str | None = None,
+    max_tokens: int | None = None,
 ) -> Optional[str]:
     """
     Centralized LLM call utility.
 
+    max_tokens caps the generated length (callers expecting a short,
+    structured answer stop paying for tokens they would discard).
+
     Guarantees:
-    - Single-flight protection (per process)
+    - Bounded concurrency (LLM_CONCURRENCY per process)
     - Controlled retries
     - Circuit breaker on repeated failure
     """
@@ -146,12 +202,12 @@ def generate_text(
 
     prompt = _guard_prompt(prompt, max_prompt_chars)
 
-    with _LLM_LOCK:
-        for attempt in range(1, max_retries + 1):
-            try:
-                provider = (LLM_PROVIDER or "ollama").lower()
-                selected_model = model or LLM_MODEL
+    provider = (LLM_PROVIDER or "ollama").lower()
+    selected_model = model or LLM_MODEL
 
+    for attempt in range(1, max_retries + 1):
+        try:
+            with _LLM_SEM:
                 if provider == "ollama":
                     return _call_ollama(
                         prompt,
@@ -159,6 +215,7 @@ def generate_text(
                         top_p,
                         timeout,
                         selected_model,
+                        max_tokens,
                     )
 
                 if provider in {"openai", "openai_compatible"}:
@@ -168,18 +225,19 @@ def generate_text(
                         top_p,
                         timeout,
                         selected_model,
+                        max_tokens,
                     )
 
-                raise RuntimeError(f"Unknown LLM_PROVIDER: {provider}")
+            raise RuntimeError(f"Unknown LLM_PROVIDER: {provider}")
 
-            except requests.exceptions.ReadTimeout:
-                print(f"⏳ LLM timeout ({attempt}/{max_retries})")
-                time.sleep(2 * attempt)
+        except requests.exceptions.ReadTimeout:
+            print(f"⏳ LLM timeout ({attempt}/{max_retries})")
+            time.sleep(2 * attempt)
 
-            except Exception as e:
-                print(f"⚠️ LLM error: {e}")
-                _LAST_FAILURE_TS = time.time()
-                break
+        except Exception as e:
+            print(f"⚠️ LLM error: {e}")
+            _LAST_FAILURE_TS = time.time()
+            break
 
     return None if return_none_on_fail else "⚠️ Insight generation unavailable."
 
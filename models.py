@@ -159,13 +159,59 @@ class InsightSnapshot(Base):
     user = relationship("User", backref="insight_snapshots")
 
 
+# =========================
+# STATEMENT PARSE JOBS (async upload)
+# =========================
+class ParseJob(Base):
+    __tablename__ = "parse_jobs"
+
+    id = Column(String(32), primary_key=True)  # uuid4 hex
+
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+
+    status = Column(String, default="queued", nullable=False)  # queued / running / success / error
+    result = Column(JSON)
+
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    finished_at = Column(DateTime)
+
+
 # =========================
 # INDEXES (performance)
 # =========================
 Index("ix_statement_user", Statement.user_id)
 Index("ix_transaction_date", Transaction.date)
 Index("ix_transaction_statement", Transaction.statement_id)
-Index("ix_goal_user_active", FinancialGoal.user_id, FinancialGoal.is_active)
+Index(
+    "ix_transaction_statement_date_id",
+    Transaction.statement_id,
+    Transaction.date.desc(),
+    Transaction.id.desc(),
+)
+# Covers WHERE user_id AND is_active ORDER BY created_at DESC (no sort);
+# partial, so deleted (inactive) goals take no index space. Queries must
+# filter on plain `is_active` (not IS TRUE) for the planner to match it.
+Index(
+    "ix_goal_user_created_active",
+    FinancialGoal.user_id,
+    FinancialGoal.created_at.desc(),
+    postgresql_where=FinancialGoal.is_active,
+    sqlite_where=FinancialGoal.is_active,
+)
+# One active goal per name; conflict target of the create_goals upsert
+Index(
+    "ux_goal_user_name_active",
+    FinancialGoal.user_id,
+    FinancialGoal.name,
+    unique=True,
+    postgresql_where=FinancialGoal.is_active,
+    sqlite_where=FinancialGoal.is_active,
+)
 Index(
     "ix_insight_user_month",
     InsightSnapshot.user_id,
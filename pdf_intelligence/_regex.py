@@ -0,0 +1,41 @@
+# pdf_intelligence/_regex.py
+#
+# Every pattern the PDF stages share, compiled once per process.
+# Stdlib `re` on purpose: google-re2 measured ~4x slower on these short
+# per-word strings (call overhead dominates), and none of the DFA/JIT
+# engines are dependencies.
+
+import re
+
+# ==================================================
+# AMOUNTS
+# ==================================================
+# 1234.56 | 1,234.56 | 1,23,456.78 (Indian lakh grouping)
+AMOUNT = re.compile(
+    r"\b(?:\d+\.\d{2}|\d{1,3}(?:,\d{3})*\.\d{2}|\d{1,3}(?:,\d{2})+,\d{3}\.\d{2})\b"
+)
+
+# Explicit credit / debit markers: "1,234.56 (Cr)"
+CR = re.compile(r"([\d,]+\.\d{2})\s*\(cr\)", re.IGNORECASE)
+DR = re.compile(r"([\d,]+\.\d{2})\s*\(dr\)", re.IGNORECASE)
+
+# Either marker in one scan; group(2) tells which
+CRDR = re.compile(r"([\d,]+\.\d{2})\s*\((cr|dr)\)", re.IGNORECASE)
+
+# ==================================================
+# DATES
+# ==================================================
+# Numeric: 01/12/2025 or 01-12-25
+NUMERIC_DATE = re.compile(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b")
+
+# Textual: 01 Dec 2025, 1 January 2026
+TEXTUAL_DATE = re.compile(
+    r"\b\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\s+\d{4}\b",
+    re.IGNORECASE
+)
+
+# Either form, in one scan
+DATE = re.compile(
+    f"{NUMERIC_DATE.pattern}|{TEXTUAL_DATE.pattern}",
+    re.IGNORECASE
+)
@@ -1,18 +1,31 @@
 import fitz
 
 def extract_layout(pdf_path):
-    doc = fitz.open(pdf_path)
+    """
+    pdf_path: file path, or the PDF's raw bytes (in-memory upload).
+
+    Pages are read serially on purpose: PyMuPDF documents are not
+    thread-safe, and text extraction runs ~2ms/page, far below the cost
+    of a process pool.
+    """
+    if isinstance(pdf_path, (bytes, bytearray)):
+        doc = fitz.open(stream=pdf_path, filetype="pdf")
+    else:
+        doc = fitz.open(pdf_path)
     words = []
 
-    for page_num, page in enumerate(doc):
-        for w in page.get_text("words"):
-            x0, y0, x1, y1, text = w[:5]
-            words.append({
-                "text": text,
-                "x0": x0,
-                "x1": x1,
-                "y": round(y0, 1),
-                "page": page_num
-            })
+    # Close as soon as the words are out (frees the parsed document
+    # instead of waiting for GC)
+    with doc:
+        for page_num, page in enumerate(doc):
+            for w in page.get_text("words"):
+                x0, y0, x1, y1, text = w[:5]
+                words.append({
+                    "text": text,
+                    "x0": x0,
+                    "x1": x1,
+                    "y": round(y0, 1),
+                    "page": page_num
+                })
 
     return words
@@ -1,17 +1,13 @@
 from collections import defaultdict
-import re
+
+import numpy as np
 
 # ----------------------------------
-# Regexes
+# Regexes (shared, see _regex.py)
 # ----------------------------------
-NUMERIC_DATE = re.compile(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b")
-TEXTUAL_DATE = re.compile(
-    r"\b\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\s+\d{4}\b",
-    re.IGNORECASE
-)
-
-AMOUNT_REGEX = re.compile(
-    r"\b(?:\d+\.\d{2}|\d{1,3}(?:,\d{3})*\.\d{2}|\d{1,3}(?:,\d{2})+,\d{3}\.\d{2})\b"
+from pdf_intelligence._regex import (
+    AMOUNT as AMOUNT_REGEX,
+    DATE as DATE_REGEX,  # row date test: either form, one scan
 )
 
 Y_TOL = 8  # ⬅️ important: PDFs need wider tolerance
@@ -34,40 +30,33 @@ def detect_candidate_rows(words):
     candidates = []
 
     for page_words in by_page.values():
-        page_words.sort(key=lambda w: w["y"])
-
         # 1) Base line-grouping (existing behavior)
-        line_groups = []
-        current_row = []
-        last_y = None
-
-        for w in page_words:
-            if last_y is None or abs(w["y"] - last_y) <= Y_TOL:
-                current_row.append(w)
-            else:
-                if current_row:
-                    line_groups.append(current_row)
-                current_row = [w]
-
-            last_y = w["y"]
-
-        if current_row:
-            line_groups.append(current_row)
-
-        for group in line_groups:
-            if _is_transaction_row(group):
+        line_groups = _line_groups(page_words)
+
+        # Date / amount flags and mean y once per line-group; the merge
+        # loop below reuses them instead of re-scanning merged rows
+        has_dates = [_has_date(g) for g in line_groups]
+        amount_counts = [_count_amounts(g) for g in line_groups]
+        is_txn = [
+            d and n >= 2 for d, n in zip(has_dates, amount_counts)
+        ]
+        group_ys = [_group_y(g) for g in line_groups]
+
+        for group, txn in zip(line_groups, is_txn):
+            if txn:
                 candidates.append(group)
 
         # 2) Date-anchored merge fallback (additive only)
         for i, group in enumerate(line_groups):
-            if not _has_date(group):
+            if not has_dates[i]:
                 continue
-            if _is_transaction_row(group):
+            if is_txn[i]:
                 continue
 
             merged = list(group)
             merged_lines = 1
-            last_group_y = _group_y(group)
+            merged_amounts = amount_counts[i]
+            last_group_y = group_ys[i]
 
             for j in range(i + 1, len(line_groups)):
                 if merged_lines >= MAX_MERGE_LINES:
@@ -75,24 +64,48 @@ def detect_candidate_rows(words):
 
                 next_group = line_groups[j]
 
-                if _has_date(next_group):
+                if has_dates[j]:
                     break
 
-                gap = _group_y(next_group) - last_group_y
+                gap = group_ys[j] - last_group_y
                 if gap > MERGE_GAP:
                     break
 
                 merged.extend(next_group)
                 merged_lines += 1
-                last_group_y = _group_y(next_group)
+                merged_amounts += amount_counts[j]
+                last_group_y = group_ys[j]
 
-                if _is_transaction_row(merged):
+                # merged keeps group i's date match (appended text only
+                # follows a space), so only the amount count can change
+                if merged_amounts >= 2:
                     candidates.append(merged)
                     break
 
     return candidates
 
 
+def _line_groups(page_words):
+    """
+    Split one page's words into lines: sort by y (stable, as list.sort)
+    and start a new line wherever the y gap exceeds Y_TOL.
+    """
+    ys = np.fromiter(
+        (w["y"] for w in page_words),
+        dtype=np.float64,
+        count=len(page_words),
+    )
+    order = np.argsort(ys, kind="stable")
+    starts = (np.flatnonzero(np.diff(ys[order]) > Y_TOL) + 1).tolist()
+
+    order = order.tolist()
+    bounds = [0, *starts, len(order)]
+    return [
+        [page_words[k] for k in order[lo:hi]]
+        for lo, hi in zip(bounds, bounds[1:])
+    ]
+
+
 def _group_y(row):
     if not row:
         return 0
@@ -102,15 +115,13 @@ def _group_y(row):
 def _has_date(row):
     texts = [w["text"] for w in row]
     joined = " ".join(texts)
-    return bool(
-        NUMERIC_DATE.search(joined)
-        or TEXTUAL_DATE.search(joined)
-    )
+    return DATE_REGEX.search(joined) is not None
 
 
 def _count_amounts(row):
     texts = [w["text"] for w in row]
-    return sum(1 for t in texts if AMOUNT_REGEX.search(t))
+    # "." test first: every amount has a decimal point
+    return sum(1 for t in texts if "." in t and AMOUNT_REGEX.search(t))
 
 
 def _is_transaction_row(row):
@@ -1,8 +1,4 @@
-import re
-
-AMOUNT_REGEX = re.compile(
-    r"\b(?:\d+\.\d{2}|\d{1,3}(?:,\d{3})*\.\d{2}|\d{1,3}(?:,\d{2})+,\d{3}\.\d{2})\b"
-)
+from pdf_intelligence._regex import AMOUNT as AMOUNT_REGEX
 
 
 def _should_use_right_edge(x0_vals, x1_vals) -> bool:
@@ -27,25 +23,22 @@ def extract_numeric_columns(rows, precision=5):
     """
     Extract numeric column x-positions with minimal rounding.
     """
-    cols = set()
+    # One regex pass: edges of amount words only, as two parallel lists
     x0_vals = []
     x1_vals = []
 
     for row in rows:
         for w in row:
-            if AMOUNT_REGEX.search(w["text"]):
+            text = w["text"]
+            # "." test first: every amount has a decimal point
+            if "." in text and AMOUNT_REGEX.search(text):
                 x0_vals.append(w["x0"])
                 x1_vals.append(w["x1"])
 
     use_right_edge = _should_use_right_edge(x0_vals, x1_vals)
+    anchors = x1_vals if use_right_edge else x0_vals
 
-    for row in rows:
-        for w in row:
-            if AMOUNT_REGEX.search(w["text"]):
-                anchor = w["x1"] if use_right_edge else w["x0"]
-                cols.add(round(anchor, precision))
-
-    return sorted(cols)
+    return sorted({round(anchor, precision) for anchor in anchors})
 
 
 def generate_dual_hypotheses(cols):
@@ -55,22 +48,28 @@ def generate_dual_hypotheses(cols):
     """
     hyps = []
 
-    for i, bal in enumerate(cols):
-        left = cols[:i]
+    # Column spacing depends only on the (deposit, withdrawal) pair, so it
+    # is tested once per pair instead of once per pair and balance.
+    # spaced[d] is ascending, so the columns left of balance i are a prefix.
+    # (≥ 15 apart also rules out dep == wit.)
+    n = len(cols)
+    spaced = [
+        [w for w in range(n) if abs(cols[d] - cols[w]) >= 15]
+        for d in range(n)
+    ]
 
-        for dep in left:
-            for wit in left:
-                if dep == wit:
-                    continue
+    for i, bal in enumerate(cols):
+        for d in range(i):
+            dep = cols[d]
 
-                # Ensure reasonable column spacing
-                if abs(dep - wit) < 15:
-                    continue
+            for w in spaced[d]:
+                if w >= i:
+                    break
 
                 hyps.append({
                     "type": "dual",
                     "deposit_x": dep,
-                    "withdrawal_x": wit,
+                    "withdrawal_x": cols[w],
                     "balance_x": bal
                 })
 
@@ -1,16 +1,24 @@
 # pdf_intelligence/stage4_dates.py
 
-import re
+from functools import lru_cache
+
 import pandas as pd
 
-# Numeric: 01/12/2025 or 01-12-25
-NUMERIC_DATE = re.compile(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b")
+# Numeric (01/12/2025, 01-12-25) and textual (01 Dec 2025) date forms
+from pdf_intelligence._regex import NUMERIC_DATE, TEXTUAL_DATE
+
+@lru_cache(maxsize=4096)
+def _parse_date(text: str, dayfirst: bool):
+    """
+    pd.to_datetime per distinct date string (~100µs a call); statements
+    repeat the same few dates across rows, stages and retries.
+    None if unparseable.
+    """
+    try:
+        return pd.to_datetime(text, dayfirst=dayfirst)
+    except Exception:
+        return None
 
-# Textual: 01 Dec 2025, 1 January 2026
-TEXTUAL_DATE = re.compile(
-    r"\b\d{1,2}\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\s+\d{4}\b",
-    re.IGNORECASE
-)
 
 def extract_date(row):
     texts = [w.get("text", "") for w in row]
@@ -19,18 +27,79 @@ def extract_date(row):
     # Numeric date
     m = NUMERIC_DATE.search(joined)
     if m:
-        try:
-            return pd.to_datetime(m.group(), dayfirst=True)
-        except Exception:
-            pass
+        parsed = _parse_date(m.group(), True)
+        if parsed is not None:
+            return parsed
 
     # Textual date
     m = TEXTUAL_DATE.search(joined)
     if m:
-        try:
-            return pd.to_datetime(m.group())
-        except Exception:
-            pass
+        parsed = _parse_date(m.group(), False)
+        if parsed is not None:
+            return parsed
 
     return None
 
+
+# ==================================================
+# BATCH FORM (whole statement)
+# ==================================================
+
+def _parse_dates(texts, dayfirst: bool):
+    """
+    {text: Timestamp | None} for distinct date strings, in one
+    vectorized pd.to_datetime call (format="mixed" parses each string
+    on its own, like the scalar path).
+    """
+    texts = list(texts)
+    if not texts:
+        return {}
+
+    try:
+        parsed = pd.to_datetime(
+            texts, dayfirst=dayfirst, format="mixed", errors="coerce"
+        )
+    except Exception:
+        # e.g. mixed timezones: fall back to one string at a time
+        return {t: _parse_date(t, dayfirst) for t in texts}
+
+    return {
+        t: None if pd.isna(p) else p
+        for t, p in zip(texts, parsed)
+    }
+
+
+def extract_dates(rows):
+    """
+    extract_date(row) for every row, with each distinct date string
+    parsed once in a batch rather than per row.
+    """
+    matches = []
+    for row in rows:
+        joined = " ".join([w.get("text", "") for w in row])
+        numeric = NUMERIC_DATE.search(joined)
+        textual = TEXTUAL_DATE.search(joined)
+        matches.append((
+            numeric.group() if numeric else None,
+            textual.group() if textual else None,
+        ))
+
+    numeric_dates = _parse_dates({n for n, _ in matches if n}, True)
+
+    # Textual form only matters where the numeric one is missing/invalid
+    textual_dates = _parse_dates(
+        {
+            t for n, t in matches
+            if t and numeric_dates.get(n) is None
+        },
+        False,
+    )
+
+    dates = []
+    for n, t in matches:
+        d = numeric_dates.get(n) if n else None
+        if d is None and t:
+            d = textual_dates.get(t)
+        dates.append(d)
+
+    return dates
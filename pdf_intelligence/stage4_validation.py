@@ -1,8 +1,29 @@
-import re
+from functools import lru_cache
 
-AMOUNT_REGEX = re.compile(
-    r"\b(?:\d+\.\d{2}|\d{1,3}(?:,\d{3})*\.\d{2}|\d{1,3}(?:,\d{2})+,\d{3}\.\d{2})\b"
-)
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # optional: pure-Python reconciliation loop
+    njit = None
+
+from pdf_intelligence._regex import AMOUNT as AMOUNT_REGEX
+
+
+@lru_cache(maxsize=8192)
+def _amount_value(text):
+    """
+    Parsed amount in a word's text (one regex search per distinct text;
+    the same words are probed for every hypothesis), or None.
+    """
+    # Every amount has a decimal point: skip the regex for the rest
+    if "." not in text:
+        return None
+
+    m = AMOUNT_REGEX.search(text)
+    if not m:
+        return None
+    return float(m.group().replace(",", ""))
 
 
 def extract_amount(row, target_x, tol=15):
@@ -10,27 +31,263 @@ def extract_amount(row, target_x, tol=15):
         return None
 
     for w in row:
-        m = AMOUNT_REGEX.search(w["text"])
-        if not m:
-            continue
-
+        # Cheap position test first; only words in the column are parsed
         if (
-            abs(w["x0"] - target_x) <= tol
-            or abs(w["x1"] - target_x) <= tol
+            abs(w["x0"] - target_x) > tol
+            and abs(w["x1"] - target_x) > tol
         ):
-            return float(m.group().replace(",", ""))
+            continue
+
+        value = _amount_value(w["text"])
+        if value is not None:
+            return value
 
     return None
 
 
-def validate_hypothesis(rows, h):
+# ==================================================
+# AMOUNT INDEX (shared across hypotheses)
+# ==================================================
+# Every hypothesis probes the same few column positions over the same
+# rows, so the amount words are laid out once as padded (row, k) arrays
+# (k = most amount words in a row, row order kept) and each column's
+# per-row amounts are computed with one mask and cached by position.
+
+def row_amount_hits(row):
+    """
+    (x0, x1, value) of every amount word in the row, in row order.
+    """
+    hits = []
+    for w in row:
+        value = _amount_value(w["text"])
+        if value is not None:
+            hits.append((w["x0"], w["x1"], value))
+    return hits
+
+
+def build_amount_index(rows, row_hits=None):
+    """
+    row_hits: optional callable row -> row_amount_hits(row), for callers
+    that already extracted them (defaults to extracting here).
+    """
+    per_row = [
+        (row_hits or row_amount_hits)(row)
+        for row in rows
+    ]
+
+    n = len(per_row)
+    k = max((len(hits) for hits in per_row), default=0)
+
+    x0 = np.full((n, k), np.nan)
+    x1 = np.full((n, k), np.nan)
+    values = np.full((n, k), np.nan)
+
+    for i, hits in enumerate(per_row):
+        for j, (a, b, v) in enumerate(hits):
+            x0[i, j] = a
+            x1[i, j] = b
+            values[i, j] = v
+
+    return {"x0": x0, "x1": x1, "values": values, "columns": {}}
+
+
+def column_array(index, target_x, tol=15):
+    """
+    extract_amount(row, target_x, tol) for every indexed row, as a
+    float64 array with NaN where the row has no amount in the column.
+    """
+    n, k = index["values"].shape
+
+    if target_x is None or k == 0:
+        return np.full(n, np.nan)
+
+    key = (target_x, tol)
+    cached = index["columns"].get(key)
+    if cached is not None:
+        return cached
+
+    # First amount word (in row order) whose left or right edge is in
+    # the column; NaN padding never matches
+    near = (
+        (np.abs(index["x0"] - target_x) <= tol)
+        | (np.abs(index["x1"] - target_x) <= tol)
+    )
+    picked = index["values"][np.arange(n), near.argmax(axis=1)]
+    cached = np.where(near.any(axis=1), picked, np.nan)
+
+    index["columns"][key] = cached
+    return cached
+
+
+def column_amounts(index, target_x, tol=15):
+    """
+    column_array as a list with None for missing amounts.
+    """
+    return [
+        None if v != v else v  # NaN check
+        for v in column_array(index, target_x, tol).tolist()
+    ]
+
+
+def _pruned(reconciled, errors, remaining, min_confidence):
+    """
+    True when even if every remaining row reconciled, the final
+    score_hypothesis (reconciled / total) would stay below
+    min_confidence.
+    """
+    return (
+        reconciled + remaining
+        < min_confidence * (reconciled + errors + remaining)
+    )
+
+
+# ==================================================
+# RECONCILIATION KERNELS (NUMBA, OPTIONAL)
+# ==================================================
+# Same arithmetic as the Python loop in validate_hypothesis, over the
+# column arrays (NaN = missing); amounts parsed from text are never NaN.
+# reconciled = -1 signals a min_confidence prune.
+if njit is not None:
+    _pruned_nb = njit(cache=True)(_pruned)
+
+    @njit(cache=True)
+    def _validate_single_nb(balances, amounts, min_confidence):
+        reconciled = 0
+        errors = 0
+        prev_balance = 0.0
+        have_prev = False
+
+        n = balances.shape[0]
+        for i in range(n):
+            bal = balances[i]
+            if np.isnan(bal):
+                continue
+
+            if not have_prev:
+                prev_balance = bal
+                have_prev = True
+                reconciled += 1
+                continue
+
+            amt = amounts[i]
+            if np.isnan(amt):
+                prev_balance = bal
+                continue
+
+            if (
+                abs(prev_balance + amt - bal) <= 1
+                or abs(prev_balance - amt - bal) <= 1
+            ):
+                reconciled += 1
+            else:
+                errors += 1
+                if _pruned_nb(reconciled, errors, n - i - 1, min_confidence):
+                    return -1, errors
+
+            prev_balance = bal
+
+        return reconciled, errors
+
+    @njit(cache=True)
+    def _validate_dual_nb(balances, deposits, withdrawals, min_confidence):
+        reconciled = 0
+        errors = 0
+        prev_balance = 0.0
+        have_prev = False
+
+        n = balances.shape[0]
+        for i in range(n):
+            bal = balances[i]
+            if np.isnan(bal):
+                continue
+
+            if not have_prev:
+                prev_balance = bal
+                have_prev = True
+                reconciled += 1
+                continue
+
+            dep = deposits[i]
+            wd = withdrawals[i]
+
+            if not np.isnan(dep):
+                if abs(prev_balance + dep - bal) <= 1:
+                    reconciled += 1
+                else:
+                    errors += 1
+                    if _pruned_nb(reconciled, errors, n - i - 1, min_confidence):
+                        return -1, errors
+            elif not np.isnan(wd):
+                if abs(prev_balance - wd - bal) <= 1:
+                    reconciled += 1
+                else:
+                    errors += 1
+                    if _pruned_nb(reconciled, errors, n - i - 1, min_confidence):
+                        return -1, errors
+            else:
+                reconciled += 1
+
+            prev_balance = bal
+
+        return reconciled, errors
+else:
+    _validate_single_nb = None
+    _validate_dual_nb = None
+
+
+def validate_hypothesis(rows, h, amount_index=None, min_confidence=None):
+    """
+    amount_index: build_amount_index(rows), shared when validating many
+    hypotheses over the same rows (built here if omitted).
+
+    min_confidence: stop early and return None once the hypothesis can
+    no longer reach this score_hypothesis confidence (branch-and-bound
+    in choose_best_hypothesis).
+    """
+    if amount_index is None:
+        amount_index = build_amount_index(rows)
+
+    # Negative bound never prunes
+    bound = -1.0 if min_confidence is None else float(min_confidence)
+
+    if _validate_single_nb is not None and h["type"] in ("single", "dual"):
+        balances = column_array(amount_index, h.get("balance_x"))
+
+        if h["type"] == "single":
+            reconciled, errors = _validate_single_nb(
+                balances,
+                column_array(amount_index, h.get("amount_x")),
+                bound,
+            )
+        else:
+            reconciled, errors = _validate_dual_nb(
+                balances,
+                column_array(amount_index, h.get("deposit_x")),
+                column_array(amount_index, h.get("withdrawal_x")),
+                bound,
+            )
+
+        if reconciled < 0:
+            return None
+
+        return {
+            "reconciled": int(reconciled),
+            "errors": int(errors),
+        }
+
+    balances = column_amounts(amount_index, h.get("balance_x"))
+
+    if h["type"] == "single":
+        amounts = column_amounts(amount_index, h.get("amount_x"))
+    elif h["type"] == "dual":
+        deposits = column_amounts(amount_index, h.get("deposit_x"))
+        withdrawals = column_amounts(amount_index, h.get("withdrawal_x"))
+
     reconciled = 0
     errors = 0
     prev_balance = None
 
-    for row in rows:
-        bal = extract_amount(row, h.get("balance_x"))
-
+    for i, bal in enumerate(balances):
         # ---------------------------------
         # Skip rows without balance
         # ---------------------------------
@@ -49,7 +306,7 @@ def validate_hypothesis(rows, h):
         # SINGLE COLUMN SCHEMA
         # ---------------------------------
         if h["type"] == "single":
-            amt = extract_amount(row, h.get("amount_x"))
+            amt = amounts[i]
 
             if amt is None:
                 prev_balance = bal
@@ -67,8 +324,8 @@ def validate_hypothesis(rows, h):
         # DUAL COLUMN SCHEMA
         # ---------------------------------
         elif h["type"] == "dual":
-            dep = extract_amount(row, h.get("deposit_x"))
-            wd  = extract_amount(row, h.get("withdrawal_x"))
+            dep = deposits[i]
+            wd  = withdrawals[i]
 
             if dep is not None:
                 if abs(prev_balance + dep - bal) <= 1:
@@ -86,6 +343,11 @@ def validate_hypothesis(rows, h):
                 # Balance-only row (interest postings, adjustments)
                 reconciled += 1
 
+        if errors and _pruned(
+            reconciled, errors, len(balances) - i - 1, bound
+        ):
+            return None
+
         prev_balance = bal
 
     return {
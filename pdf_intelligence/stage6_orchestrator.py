@@ -3,20 +3,54 @@ from pdf_intelligence.stage3_hypotheses import (
     generate_dual_hypotheses,
     generate_single_amount_hypotheses
 )
-from pdf_intelligence.stage4_validation import validate_hypothesis
-from pdf_intelligence.stage4_dates import extract_date
+from pdf_intelligence.stage4_validation import (
+    build_amount_index,
+    row_amount_hits,
+    validate_hypothesis,
+)
+from pdf_intelligence.stage4_dates import extract_dates
 from pdf_intelligence.stage5_confidence import score_hypothesis
 
+# Ranking multiplier for dual (deposit + withdrawal) schemas
+DUAL_BOOST = 1.3
+
+
+def build_row_features(rows):
+    """
+    Per-row date + amount words ("rows", keyed by id(row)) and a memo of
+    choose_best_hypothesis results by date-sorted row order ("results").
+
+    Retry variants (reversed / trimmed) reuse the same row objects, so
+    features built once for the full row list serve every variant:
+        features = build_row_features(rows)
+        choose_best_hypothesis(variant_rows, features=features)
+    A variant that sorts to an order already ranked (the retry's own
+    "original" pass; "reversed" unless rows share a date) is not
+    re-validated.
+    Only valid while `rows` is alive (ids are not reused until then).
+    """
+    return {
+        "rows": {
+            id(r): (d, row_amount_hits(r))
+            for r, d in zip(rows, extract_dates(rows))
+        },
+        "results": {},
+    }
+
 
-def choose_best_hypothesis(rows, min_rows=5):
+def choose_best_hypothesis(rows, min_rows=5, features=None):
     """
     Selects the best schema hypothesis.
     - Uses ranking_score for comparison
     - Returns calibrated confidence ∈ [0, 1]
+    - features: build_row_features() over rows (or a superset of them)
     """
+    if features is None:
+        features = build_row_features(rows)
+
     dated = []
     for r in rows:
-        d = extract_date(r)
+        d = features["rows"][id(r)][0]
         if d is not None:
             dated.append((d, r))
 
@@ -27,15 +61,28 @@ def choose_best_hypothesis(rows, min_rows=5):
         print(i, d, [w["text"] for w in r])
 
     # -------------------------------
-    # Filter rows with valid dates
+    # Filter rows with valid dates (collected above)
     # -------------------------------
-    dated = [(extract_date(r), r) for r in rows if extract_date(r) is not None]
     if len(dated) < min_rows:
         return None, 0.0
 
     dated.sort(key=lambda x: x[0])
     sorted_rows = [r for _, r in dated]
 
+    key = (min_rows, tuple(id(r) for r in sorted_rows))
+    if key not in features["results"]:
+        features["results"][key] = _rank_hypotheses(
+            sorted_rows, features, min_rows
+        )
+
+    return features["results"][key]
+
+
+def _rank_hypotheses(sorted_rows, features, min_rows):
+    """
+    Validate + rank every column hypothesis over date-sorted rows.
+    Returns (schema, confidence) or (None, 0.0).
+    """
     # -------------------------------
     # Generate hypotheses
     # -------------------------------
@@ -44,13 +91,35 @@ def choose_best_hypothesis(rows, min_rows=5):
     dual_hyps = generate_dual_hypotheses(cols)
     single_hyps = generate_single_amount_hypotheses(cols)
 
-    evaluated = []
-
     # -------------------------------
     # Validate + score hypotheses
     # -------------------------------
+    # Amount words laid out once; each column position is resolved once
+    # and shared by every hypothesis that uses it
+    amount_index = build_amount_index(
+        sorted_rows,
+        row_hits=lambda r: features["rows"][id(r)][1],
+    )
+
+    # Running argmax: strict ">" keeps the earliest of tied hypotheses.
+    # Branch-and-bound: a hypothesis is abandoned mid-validation once its
+    # confidence cannot beat the best ranking so far (the epsilon absorbs
+    # rounding)
+    best_ranking = None
+    best_schema = None
+    best_confidence = 0.0
+
     for h in dual_hyps + single_hyps:
-        res = validate_hypothesis(sorted_rows, h)
+        min_confidence = None
+        if best_ranking is not None:
+            boost = DUAL_BOOST if h["type"] == "dual" else 1.0
+            min_confidence = best_ranking / boost - 1e-9
+
+        res = validate_hypothesis(
+            sorted_rows, h, amount_index, min_confidence
+        )
+        if res is None:
+            continue
 
         total = res["reconciled"] + res["errors"]
         if total < min_rows:
@@ -64,25 +133,17 @@ def choose_best_hypothesis(rows, min_rows=5):
 
         # ✅ Prefer dual schema ONLY for ranking
         if h["type"] == "dual":
-            ranking_score *= 1.3
+            ranking_score *= DUAL_BOOST
 
-        evaluated.append({
-            "schema": h,
-            "ranking_score": ranking_score,
-            "confidence": base_confidence
-        })
+        if best_ranking is None or ranking_score > best_ranking:
+            best_ranking = ranking_score
+            best_schema = h
+            best_confidence = base_confidence
 
-    if not evaluated:
+    if best_schema is None:
         return None, 0.0
 
-    # -------------------------------
-    # Select best hypothesis
-    # -------------------------------
-    best = max(evaluated, key=lambda x: x["ranking_score"])
-
-    final_schema = best["schema"]
-
     # ✅ HARD CLAMP confidence
-    final_confidence = min(1.0, max(0.0, best["confidence"]))
+    final_confidence = min(1.0, max(0.0, best_confidence))
 
-    return final_schema, final_confidence
+    return best_schema, final_confidence
@@ -15,8 +15,10 @@ def retry_with_variants(
     # 1️⃣ Original
     variants.append(("original", rows))
 
-    # 2️⃣ Reverse order
-    variants.append(("reversed", list(reversed(rows))))
+    # 2️⃣ Reverse order (after the date sort this only differs from the
+    # original for same-date rows; choose_best_hypothesis memoizes by
+    # sorted order when given shared features, so it costs one sort)
+    variants.append(("reversed", rows[::-1]))
 
     # 3️⃣ Drop first 3 rows (skip headers / opening balance)
     if len(rows) > 6:
@@ -3,7 +3,9 @@
 import json
 from typing import List, Dict, Any
 
-from llm.adapter import generate_text, is_llm_enabled
+from llm.adapter import generate_text, is_llm_enabled, json_dumps
+
+_JSON_DECODER = json.JSONDecoder()
 
 
 # ==================================================
@@ -23,6 +25,44 @@ Rules:
 """
 
 
+# ==================================================
+# PROMPT PAYLOAD (COMPACT)
+# ==================================================
+def _candidates_json(candidates: List[Dict[str, Any]]) -> str:
+    """
+    Candidates as compact JSON for the prompt: index + schema (column
+    positions to 0.1pt) + confidence. Every prompt token is LLM time;
+    the retry variant name tells the judge nothing about plausibility.
+    """
+    payload = [
+        {
+            "index": i,
+            "schema": {
+                k: round(v, 1) if isinstance(v, float) else v
+                for k, v in (c.get("schema") or {}).items()
+            },
+            "confidence": round(c.get("confidence", 0.0), 3),
+        }
+        for i, c in enumerate(candidates)
+    ]
+    return json_dumps(payload).decode()
+
+
+def _first_json_object(raw: str) -> Dict[str, Any] | None:
+    """
+    First complete JSON object in the reply (raw_decode stops at its
+    closing brace, so trailing chatter or a second object is ignored).
+    """
+    start = raw.find("{")
+    while start != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(raw, start)
+            return obj
+        except ValueError:
+            start = raw.find("{", start + 1)
+    return None
+
+
 # ==================================================
 # LLM ARBITRATION (BACKEND ONLY)
 # ==================================================
@@ -62,7 +102,7 @@ def llm_arbitrate(
 {SYSTEM_PROMPT}
 
 Candidates:
-{json.dumps(candidates, indent=2)}
+{_candidates_json(candidates)}
 
 Choose the best schema.
 
@@ -80,6 +120,8 @@ Output JSON:
             top_p=1.0,
             timeout=30,
             return_none_on_fail=True,
+            # {"winner_index": n} is a handful of tokens
+            max_tokens=64,
         )
 
         if not raw:
@@ -88,12 +130,10 @@ Output JSON:
         # -------------------------------
         # Strict JSON extraction
         # -------------------------------
-        start, end = raw.find("{"), raw.rfind("}") + 1
-        if start == -1 or end == -1:
+        result = _first_json_object(raw)
+        if result is None:
             return None
 
-        result = json.loads(raw[start:end])
-
         idx = result.get("winner_index")
 
         if not isinstance(idx, int):
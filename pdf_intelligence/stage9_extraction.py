@@ -1,5 +1,6 @@
 import re
-from pdf_intelligence.stage4_dates import extract_date
+from pdf_intelligence import _regex
+from pdf_intelligence.stage4_dates import extract_dates
 from pdf_intelligence.stage4_validation import extract_amount
 
 SUMMARY_KEYWORDS = [
@@ -7,20 +8,25 @@ SUMMARY_KEYWORDS = [
     "summary", "interest", "page", "statement"
 ]
 
-CR_REGEX = re.compile(r"([\d,]+\.\d{2})\s*\(cr\)", re.IGNORECASE)
-DR_REGEX = re.compile(r"([\d,]+\.\d{2})\s*\(dr\)", re.IGNORECASE)
+# All keywords in one scan of the row text
+SUMMARY_REGEX = re.compile("|".join(map(re.escape, SUMMARY_KEYWORDS)))
 
-BALANCE_NUMBER_REGEX = re.compile(
-    r"\b(?:\d+\.\d{2}|\d{1,3}(?:,\d{3})*\.\d{2}|\d{1,3}(?:,\d{2})+,\d{3}\.\d{2})\b"
-)
+CR_REGEX = _regex.CR
+DR_REGEX = _regex.DR
+CRDR_REGEX = _regex.CRDR  # either marker; group(2) tells which
+BALANCE_NUMBER_REGEX = _regex.AMOUNT
+
+# str.isalpha restricted to ASCII, as one C-level scan
+ASCII_ALPHA_REGEX = re.compile(r"[A-Za-z]")
 
 
 # --------------------------------------------------
 # Row filters
 # --------------------------------------------------
 def is_summary_row(row):
-    text = " ".join(w["text"].lower() for w in row)
-    return any(k in text for k in SUMMARY_KEYWORDS)
+    # Join + lowercase once per row (not once per keyword)
+    text = " ".join([w["text"] for w in row]).lower()
+    return SUMMARY_REGEX.search(text) is not None
 
 
 # --------------------------------------------------
@@ -33,11 +39,17 @@ def clean_description(text: str, balance: float | None):
     if not text:
         return ""
 
+    # (Cr)/(Dr) amounts, the balance and numeric tokens all contain a
+    # decimal point: without one only whitespace needs normalizing
+    if "." not in text:
+        return " ".join(text.split())
+
     cleaned = text
 
-    # Remove explicit (Cr)/(Dr)
-    cleaned = CR_REGEX.sub("", cleaned)
-    cleaned = DR_REGEX.sub("", cleaned)
+    # Remove explicit (Cr)/(Dr) (both need a "(")
+    if "(" in cleaned:
+        cleaned = CR_REGEX.sub("", cleaned)
+        cleaned = DR_REGEX.sub("", cleaned)
 
     # Remove raw balance number if present
     if balance is not None:
@@ -50,12 +62,22 @@ def clean_description(text: str, balance: float | None):
     return " ".join(cleaned.split()).strip()
 
 
+def has_alpha(text: str) -> bool:
+    """
+    any(c.isalpha() for c in text), without a per-character generator
+    for the (usual) ASCII words.
+    """
+    if text.isascii():
+        return ASCII_ALPHA_REGEX.search(text) is not None
+    return any(c.isalpha() for c in text)
+
+
 def extract_description(row, exclude_x=None, tol=15):
     parts = []
     for w in row:
         if exclude_x is not None and abs(w["x0"] - exclude_x) <= tol:
             continue
-        if any(c.isalpha() for c in w["text"]):
+        if has_alpha(w["text"]):
             parts.append(w["text"])
     return " ".join(parts).strip()
 
@@ -72,14 +94,22 @@ def extract_explicit_dr_cr(row, balance_x, tol=15):
             continue  # ignore balance column
 
         text = w["text"]
+        if "(" not in text:
+            continue  # no (Cr)/(Dr) marker
+
+        m = CRDR_REGEX.search(text)
+        if not m:
+            continue
 
-        cr = CR_REGEX.search(text)
-        if cr:
-            return float(cr.group(1).replace(",", "")), 0.0
+        if m.group(2).lower() == "dr":
+            # (Cr) wins when a word carries both; any (Cr) match starts
+            # after this (Dr) one
+            cr = CR_REGEX.search(text, m.end())
+            if cr is None:
+                return 0.0, float(m.group(1).replace(",", ""))
+            m = cr
 
-        dr = DR_REGEX.search(text)
-        if dr:
-            return 0.0, float(dr.group(1).replace(",", ""))
+        return float(m.group(1).replace(",", "")), 0.0
 
     return None, None
 
@@ -91,15 +121,22 @@ def extract_transactions(rows, schema, confidence, source_pdf):
     transactions = []
     prev_balance = None
 
-    for row in rows:
+    # Loop invariants hoisted; dates parsed in one batch for all rows
+    balance_x = schema.get("balance_x")
+    deposit_x = schema.get("deposit_x")
+    withdrawal_x = schema.get("withdrawal_x")
+    amount_x = schema.get("amount_x")
+    is_dual = schema["type"] == "dual"
+    confidence = round(confidence, 3)
+
+    for row, date in zip(rows, extract_dates(rows)):
         if is_summary_row(row):
             continue
 
-        date = extract_date(row)
         if date is None:
             continue
 
-        balance = extract_amount(row, schema.get("balance_x"))
+        balance = extract_amount(row, balance_x)
         if balance is None:
             continue
 
@@ -108,13 +145,13 @@ def extract_transactions(rows, schema, confidence, source_pdf):
         # 1️⃣ Explicit Cr / Dr (highest priority)
         deposit, withdrawal = extract_explicit_dr_cr(
             row,
-            balance_x=schema.get("balance_x")
+            balance_x=balance_x
         )
 
         # 2️⃣ Dual schema support
-        if deposit is None and withdrawal is None and schema["type"] == "dual":
-            dep = extract_amount(row, schema.get("deposit_x"))
-            wd = extract_amount(row, schema.get("withdrawal_x"))
+        if deposit is None and withdrawal is None and is_dual:
+            dep = extract_amount(row, deposit_x)
+            wd = extract_amount(row, withdrawal_x)
 
             if dep is not None:
                 deposit, withdrawal = dep, 0.0
@@ -136,7 +173,7 @@ def extract_transactions(rows, schema, confidence, source_pdf):
 
         raw_desc = extract_description(
             row,
-            exclude_x=schema.get("amount_x")
+            exclude_x=amount_x
         )
 
         description = clean_description(raw_desc, balance)
@@ -148,7 +185,7 @@ def extract_transactions(rows, schema, confidence, source_pdf):
             "deposit": round(deposit, 2),
             "withdrawal": round(withdrawal, 2),
             "balance": round(balance, 2),
-            "confidence": round(confidence, 3),
+            "confidence": confidence,
             "source_pdf": source_pdf
         })
 
@@ -1,4 +1,6 @@
+from functools import partial
 from typing import Dict, Any
+from sqlalchemy import func, insert, update
 from sqlalchemy.orm import Session
 
 from agent.user_profile import UserProfile
@@ -9,13 +11,16 @@ from agent.goal_engine import FinancialGoal as FinancialGoalEngine
 # PDF intelligence
 from pdf_intelligence.stage1_layout import extract_layout
 from pdf_intelligence.stage2_tables import detect_candidate_rows
-from pdf_intelligence.stage6_orchestrator import choose_best_hypothesis
+from pdf_intelligence.stage6_orchestrator import (
+    build_row_features,
+    choose_best_hypothesis,
+)
 from pdf_intelligence.stage7_retry import retry_with_variants
 from pdf_intelligence.stage8_llm_arbitration import llm_arbitrate
 from pdf_intelligence.stage9_extraction import extract_transactions
 
 # Analytics
-from analytics.metrics import compute_metrics_from_df
+from analytics.metrics import compute_metrics_from_df, normalize_descriptions
 from analytics.categorization import (
     add_categories,
     category_summary,
@@ -33,65 +38,117 @@ from agent.insights.utils import make_json_safe
 # DB models
 from models import Statement, Transaction
 
+import numpy as np
 import pandas as pd
 
+# Arrow-backed strings with NaN for missing values (the pandas 3 default
+# "str" dtype, pinned for older pandas): string masks / isin / groupby run
+# as Arrow kernels. NaN rather than pd.NA keeps row-wise code unchanged.
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = pd.StringDtype("pyarrow", na_value=np.nan)
+except (ImportError, TypeError):  # no pyarrow / pandas < 2.3
+    STRING_DTYPE = None
+
+STRING_DF_COLUMNS = ("description", "merchant", "category", "txn_type")
+
 
 # ==================================================
 # HELPERS
 # ==================================================
-def transactions_to_df(transactions) -> pd.DataFrame:
-    rows = []
-
-    for t in transactions:
-        amount = float(t.amount)
-
-        rows.append(
-            {   
-                "id": t.id,
-                "date": t.date,
-                "description": t.description,
-
-                # CSV-era semantics (REQUIRED by analytics)
-                "deposit": amount if amount > 0 else 0.0,
-                "withdrawal": -amount if amount < 0 else 0.0,
-                "amount": amount,
-
-                # Optional / legacy fields
-                "balance": (
-                    t.raw.get("balance")
-                    if isinstance(t.raw, dict)
-                    else None
-                ),
-                "confidence": (
-                    t.raw.get("confidence", 1.0)
-                    if isinstance(t.raw, dict)
-                    else 1.0
-                ),
-
-                # New DB-native fields
-                "merchant": t.merchant,
-                "category": t.category,
-                "txn_type": t.txn_type,
-            }
-        )
+# Exactly the columns transactions_to_df reads: analytics queries select
+# these as plain rows instead of hydrating full ORM instances. The two
+# legacy raw-JSON fields are extracted by the database (->> / json_extract,
+# NULL when absent or raw is not an object), not per row in Python
+TRANSACTION_DF_COLUMNS = (
+    Transaction.id,
+    Transaction.date,
+    Transaction.description,
+    Transaction.amount,
+    Transaction.raw["balance"].as_float().label("balance"),
+    func.coalesce(
+        Transaction.raw["confidence"].as_float(), 1.0
+    ).label("confidence"),
+    Transaction.merchant,
+    Transaction.category,
+    Transaction.txn_type,
+)
+
+
+def df_records(df: pd.DataFrame) -> list[dict]:
+    """
+    df.to_dict(orient="records"), built by zipping whole columns
+    (one .tolist() per column instead of per-row boxing; ~4x faster).
+    """
+    cols = df.columns.tolist()
+    return [
+        dict(zip(cols, values))
+        for values in zip(*(df[c].tolist() for c in cols))
+    ]
 
-    return pd.DataFrame(rows)
+
+def transactions_to_df(transactions) -> pd.DataFrame:
+    transactions = list(transactions)
+    if not transactions:
+        return pd.DataFrame()
+
+    # Rows (TRANSACTION_DF_COLUMNS) transposed into columns in one C-level
+    # zip, not one attribute lookup per row per column; everything
+    # derivable from them is then computed column-wise
+    col = dict(zip(transactions[0]._fields, map(list, zip(*transactions))))
+    amount = np.array(col["amount"], dtype=np.float64)
+
+    df = pd.DataFrame({
+        "id": col["id"],
+        "date": col["date"],
+        "description": col["description"],
+
+        # CSV-era semantics (REQUIRED by analytics). One ufunc pass each;
+        # fmax/fmin map NaN to 0 like the comparisons did, and "0.0 -"
+        # (not negation) keeps zero amounts from becoming -0.0
+        "deposit": np.fmax(amount, 0.0),
+        "withdrawal": 0.0 - np.fmin(amount, 0.0),
+        "amount": amount,
+
+        # Optional / legacy fields
+        "balance": np.array(col["balance"], dtype=np.float64),
+        "confidence": col["confidence"],
+
+        # New DB-native fields
+        "merchant": col["merchant"],
+        "category": col["category"],
+        "txn_type": col["txn_type"],
+    })
+
+    # Type dates / strings and normalize descriptions once at ingestion
+    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    if STRING_DTYPE is not None:
+        df = df.astype(dict.fromkeys(STRING_DF_COLUMNS, STRING_DTYPE))
+    df["description_norm"] = normalize_descriptions(df["description"])
+
+    return df
 
 
 # ==================================================
 # 1️⃣ PARSE STATEMENT (UPLOAD)
 # ==================================================
-def parse_statement(
-    *,
-    db: Session,
+def extract_statement(
     pdf_path: str,
-    user_id: int
+    pdf_bytes: bytes | None = None,
 ) -> Dict[str, Any]:
-
-    words = extract_layout(pdf_path)
+    """
+    CPU half of parse_statement (layout → schema → transactions), with
+    no DB access so it can run in a worker process. Returns
+    {"status": "success", "final", "trace", "transactions"} or an
+    error dict.
+    """
+    words = extract_layout(pdf_bytes if pdf_bytes is not None else pdf_path)
     rows = detect_candidate_rows(words)
 
-    schema, confidence = choose_best_hypothesis(rows)
+    # Dates + amount words extracted once; retry variants reuse the rows
+    choose = partial(choose_best_hypothesis, features=build_row_features(rows))
+
+    schema, confidence = choose(rows)
 
     schema_type = schema.get("type") if isinstance(schema, dict) else None
     trace = {
@@ -104,7 +161,7 @@ def parse_statement(
     }
 
     if confidence < 0.9:
-        retry_result = retry_with_variants(rows, choose_best_hypothesis)
+        retry_result = retry_with_variants(rows, choose)
 
         candidates = retry_result.get("candidates", [])
         trace["retry"] = {
@@ -163,6 +220,12 @@ def parse_statement(
     if not final.get("schema"):
         return {"status": "error", "message": "Schema detection failed"}
 
+    final = {
+        "schema": final["schema"],
+        "confidence": final.get("confidence"),
+        "variant": final.get("variant", "original"),
+    }
+
     final_schema_type = (
         final.get("schema", {}).get("type")
         if isinstance(final.get("schema"), dict)
@@ -174,14 +237,6 @@ def parse_statement(
         "schema_type": final_schema_type,
     }
 
-    # Create statement row
-    statement = Statement(
-        user_id=user_id,
-        original_filename=pdf_path
-    )
-    db.add(statement)
-    db.flush()  # get statement.id
-
     transactions = extract_transactions(
         rows=rows,
         schema=final["schema"],
@@ -189,21 +244,70 @@ def parse_statement(
         source_pdf=pdf_path
     )
 
-    # Persist transactions
-    db.bulk_save_objects(
-        [
-            Transaction(
-                statement_id=statement.id,
-                date=txn["date"],
-                description=txn["description"],
-                merchant=txn.get("merchant"),
-                amount=txn["amount"],
-                txn_type=txn.get("type"),
-                raw=txn,
-            )
-            for txn in transactions
-        ]
+    return {
+        "status": "success",
+        "final": final,
+        "trace": trace,
+        "transactions": transactions,
+    }
+
+
+def parse_statement(
+    *,
+    db: Session,
+    pdf_path: str,
+    user_id: int,
+    pdf_bytes: bytes | None = None,
+    executor=None,
+) -> Dict[str, Any]:
+    """
+    pdf_bytes: uploaded PDF already in memory; pdf_path is then only
+    the name recorded on the Statement / transactions.
+
+    executor: optional process pool for extract_statement, so parses
+    running on several threads use several cores instead of sharing
+    one GIL. None = extract in this thread.
+    """
+    if executor is not None:
+        extracted = executor.submit(
+            extract_statement, pdf_path, pdf_bytes
+        ).result()
+    else:
+        extracted = extract_statement(pdf_path, pdf_bytes)
+
+    if extracted.get("status") != "success":
+        return extracted
+
+    final = extracted["final"]
+    trace = extracted["trace"]
+    transactions = extracted["transactions"]
+
+    # Create statement row
+    statement = Statement(
+        user_id=user_id,
+        original_filename=pdf_path
     )
+    db.add(statement)
+    db.flush()  # get statement.id
+
+    # Persist transactions: one executemany of plain parameter dicts
+    # (no ORM instances / unit of work; psycopg batches the round trips)
+    if transactions:
+        db.execute(
+            insert(Transaction),
+            [
+                {
+                    "statement_id": statement.id,
+                    "date": txn["date"],
+                    "description": txn["description"],
+                    "merchant": txn.get("merchant"),
+                    "amount": txn["amount"],
+                    "txn_type": txn.get("type"),
+                    "raw": txn,
+                }
+                for txn in transactions
+            ],
+        )
 
     db.commit()
 
@@ -263,7 +367,7 @@ from analytics.categorization import (
     category_summary_all_debits,
 )
 from analytics.counterparty_analysis import upi_counterparty_summary
-from analytics.merchant_normalizer import normalize_merchant
+from analytics.merchant_normalizer import merchant_columns
 
 
 def compute_analytics(
@@ -272,10 +376,14 @@ def compute_analytics(
     user_id: int,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
+    with_recent_sample: bool = False,
 ) -> Dict[str, Any]:
     """
     Deterministic financial analytics.
 
+    with_recent_sample: also return the latest 50 transactions as
+    "recent_sample" (insights input; not part of the analytics API).
+
     Guarantees:
     - DB is the single source of truth
     - LLM runs ONLY for uncategorized transactions
@@ -288,8 +396,8 @@ def compute_analytics(
     # 1️⃣ Fetch transactions (DB = source of truth)
     # --------------------------------------------------
     q = (
-        db.query(Transaction)
-        .join(Statement)
+        db.query(*TRANSACTION_DF_COLUMNS)
+        .join(Statement, Transaction.statement_id == Statement.id)
         .filter(Statement.user_id == user_id)
     )
 
@@ -326,14 +434,8 @@ def compute_analytics(
     # --------------------------------------------------
     # 🔧 ALWAYS derive merchant + UPI metadata (NO LLM)
     # --------------------------------------------------
-    merchant_data = df["description"].apply(normalize_merchant)
-
-    df["merchant"] = merchant_data.apply(
-        lambda x: (x.get("merchant_name") or "").upper()
-    )
-
-    df["upi_id"] = merchant_data.apply(
-        lambda x: x.get("upi_id")
+    df["merchant"], df["upi_id"] = merchant_columns(
+        df["description"].tolist()
     )
 
     # --------------------------------------------------
@@ -344,15 +446,18 @@ def compute_analytics(
     # --------------------------------------------------
     # 5️⃣ Financial invariants (HARD GUARDS)
     # --------------------------------------------------
-    assert metrics["total_income"] >= 0, "Income cannot be negative"
-    assert metrics["total_expense"] >= 0, "Expense cannot be negative"
+    # Asserts are stripped under `python -O`; the __debug__ block drops
+    # the delta computation with them
+    if __debug__:
+        assert metrics["total_income"] >= 0, "Income cannot be negative"
+        assert metrics["total_expense"] >= 0, "Expense cannot be negative"
 
-    delta = (
-        metrics["total_income"]
-        - metrics["total_expense"]
-        - metrics["net_cashflow"]
-    )
-    assert abs(delta) < 0.01, "Cashflow invariant violated"
+        delta = (
+            metrics["total_income"]
+            - metrics["total_expense"]
+            - metrics["net_cashflow"]
+        )
+        assert abs(delta) < 0.01, "Cashflow invariant violated"
 
     # --------------------------------------------------
     # 6️⃣ LAZY CATEGORIZATION (ONLY IF MISSING)
@@ -363,32 +468,39 @@ def compute_analytics(
     )
 
     if missing_mask.any():
-        df_missing = df_txn[missing_mask].copy()
-
-        # 🔥 Rules + LLM pipeline
-        df_missing = add_categories(df_missing)
-
-        # Persist back to DB (ONE TIME)
-        txn_by_id = {t.id: t for t in txns}
-
-        for _, row in df_missing.iterrows():
-            txn = txn_by_id.get(row["id"])
-            if not txn:
-                continue
+        # 🔥 Rules + LLM pipeline. Only the columns it reads + the key
+        # (boolean indexing already copies; add_categories copies again
+        # before writing, so no defensive .copy() here)
+        df_missing = add_categories(
+            df_txn.loc[missing_mask, ["id", "description", "amount"]]
+        )
 
-            txn.category = row["category"]
-            txn.category_confidence = row["category_confidence"]
-            txn.category_source = row["category_source"]
+        # Persist back to DB (ONE TIME): one executemany UPDATE by
+        # primary key, no ORM instances loaded
+        db.execute(
+            update(Transaction),
+            [
+                {
+                    "id": int(txn_id),
+                    "category": category,
+                    "category_confidence": confidence,
+                    "category_source": source,
+                }
+                for txn_id, category, confidence, source in zip(
+                    df_missing["id"],
+                    df_missing["category"],
+                    df_missing["category_confidence"],
+                    df_missing["category_source"],
+                )
+            ],
+        )
 
         db.commit()
 
-        # Merge results back
-        df_txn.loc[
-            missing_mask,
-            ["category", "category_confidence", "category_source"],
-        ] = df_missing[
-            ["category", "category_confidence", "category_source"]
-        ].values
+        # Merge results back, column by column aligned on the index
+        # (no row-major .values copy of mixed-type columns)
+        for col in ("category", "category_confidence", "category_source"):
+            df_txn.loc[missing_mask, col] = df_missing[col]
 
     # 🔐 Safety: analytics must never see uncategorized rows
     assert not df_txn["category"].isna().any(), "Uncategorized txns remain"
@@ -401,8 +513,18 @@ def compute_analytics(
     upi_summary = upi_counterparty_summary(df_txn)
 
     metrics["top_upi_counterparties"] = (
-        upi_summary.to_dict(orient="records")
+        df_records(upi_summary)
     )
+
+    # Latest 50 transactions (insights pattern input), taken from the
+    # frame already in memory instead of a second query
+    recent_sample = None
+    if with_recent_sample:
+        recent = df_txn.nlargest(50, "date")[
+            ["date", "description", "merchant", "amount", "category"]
+        ].copy()
+        recent["date"] = recent["date"].dt.strftime("%Y-%m-%d")
+        recent_sample = df_records(recent)
  # --------------------------------------------------
     # 7️⃣.5 Trend analytics (COMPARATIVE)
     # --------------------------------------------------
@@ -437,7 +559,7 @@ def compute_analytics(
             .round(4)
         )
 
-        month_over_month = df_mom.to_dict(orient="records")
+        month_over_month = df_records(df_mom)
 
     # ---- Yearly aggregation ----
     df_txn["year"] = df_txn["date"].dt.year.astype(str)
@@ -485,7 +607,7 @@ def compute_analytics(
             .round(4)
         )
 
-        year_over_year = df_yoy.to_dict(orient="records")
+        year_over_year = df_records(df_yoy)
 
     # --------------------------------------------------
     # 8️⃣ Audit metadata (DEBUG + TRUST)
@@ -516,29 +638,45 @@ def compute_analytics(
     # --------------------------------------------------
     # 🔟 Final payload
     # --------------------------------------------------
-    return {
+    result = {
         "status": "success",
         "period": period_meta,
         "metrics": metrics,
-        "categories": category_spending.to_dict(orient="records"),
-        "debits": all_debits.to_dict(orient="records"),
+        "categories": df_records(category_spending),
+        "debits": df_records(all_debits),
         "trends": {
             "monthly": metrics["monthly_timeseries"],
             "month_over_month": month_over_month,
-            "yearly": yearly_df.to_dict(orient="records"),
+            "yearly": df_records(yearly_df),
             "year_over_year": year_over_year,
         },
     }
 
+    if with_recent_sample:
+        result["recent_sample"] = recent_sample
+
+    return result
+
 
 # ==================================================
 # 3️⃣ INSIGHTS (LLM)
 # ==================================================
 from typing import Dict, Any
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from models import Transaction, Statement, InsightSnapshot
 from pipeline.core import compute_analytics
+from response_cache import get_cached, set_cached
+from sqlalchemy import func
+from concurrent.futures import ThreadPoolExecutor
+
+from llm.adapter import is_llm_enabled
+
+try:
+    from config.llm import LLM_CONCURRENCY
+except ImportError:
+    LLM_CONCURRENCY = 1
 
 from agent.insights.financial_summary import generate_financial_summary
 from agent.insights.transaction_patterns import generate_transaction_patterns
@@ -546,6 +684,65 @@ from agent.insights.category_insights import generate_category_insights
 from datetime import datetime
 
 
+# --------------------------------------------------
+# Analytics memo (keyed on the user's transaction set)
+# --------------------------------------------------
+# Transactions are insert-only apart from category writes (lazy backfill,
+# which never changes the analytics output, and user corrections, which
+# call invalidate_user). So (count, max id, max created_at) identifies the
+# transaction set: any upload changes the key and stale entries just age
+# out. Keys live under the "analytics:<user_id>:" prefix, so
+# invalidate_user drops them too.
+def _transactions_fingerprint(db: Session, user_id: int) -> str:
+    count, max_id, max_created = (
+        db.query(
+            func.count(Transaction.id),
+            func.max(Transaction.id),
+            func.max(Transaction.created_at),
+        )
+        .join(Statement, Transaction.statement_id == Statement.id)
+        .filter(Statement.user_id == user_id)
+        .one()
+    )
+    created = max_created.isoformat() if max_created else ""
+    return f"{count}:{max_id or 0}:{created}"
+
+
+def cached_compute_analytics(
+    *,
+    db: Session,
+    user_id: int,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    with_recent_sample: bool = False,
+    refresh: bool = False,
+) -> Dict[str, Any]:
+    """
+    compute_analytics, memoized per (user, date range, transaction set).
+    refresh=True recomputes and replaces the memoized entry.
+    """
+    fingerprint = _transactions_fingerprint(db, user_id)
+    key = (
+        f"analytics:{user_id}:memo:"
+        f"{start_date.isoformat() if start_date else ''}:"
+        f"{end_date.isoformat() if end_date else ''}:{fingerprint}"
+        f"{':sample' if with_recent_sample else ''}"
+    )
+    cached = None if refresh else get_cached(key)
+    if cached is not None:
+        return cached
+
+    result = compute_analytics(
+        db=db,
+        user_id=user_id,
+        start_date=start_date,
+        end_date=end_date,
+        with_recent_sample=with_recent_sample,
+    )
+    set_cached(key, result)
+    return result
+
+
 def _month_start(dt: datetime | None = None):
     dt = dt or datetime.utcnow()
     return datetime(dt.year, dt.month, 1).date()
@@ -566,32 +763,31 @@ def _upsert_insight_snapshot(
     safe_transaction_patterns = make_json_safe(transaction_patterns)
     safe_metrics = make_json_safe(metrics)
 
-    existing = (
-        db.query(InsightSnapshot)
-        .filter(
-            InsightSnapshot.user_id == user_id,
-            InsightSnapshot.snapshot_month == month,
-        )
-        .first()
-    )
+    values = {
+        "financial_summary": safe_financial_summary,
+        "category_insights": safe_category_insights,
+        "transaction_patterns": safe_transaction_patterns,
+        "metrics": safe_metrics,
+        "created_at": datetime.utcnow(),
+    }
 
-    if existing:
-        existing.financial_summary = safe_financial_summary
-        existing.category_insights = safe_category_insights
-        existing.transaction_patterns = safe_transaction_patterns
-        existing.metrics = safe_metrics
-        existing.created_at = datetime.utcnow()
-        snapshot = existing
-    else:
-        snapshot = InsightSnapshot(
-            user_id=user_id,
-            snapshot_month=month,
-            financial_summary=safe_financial_summary,
-            category_insights=safe_category_insights,
-            transaction_patterns=safe_transaction_patterns,
-            metrics=safe_metrics,
+    # One round trip: insert this month's snapshot or overwrite it
+    # (conflict target = ix_insight_user_month), no SELECT first
+    snapshot = db.execute(
+        pg_insert(InsightSnapshot)
+        .values(user_id=user_id, snapshot_month=month, **values)
+        .on_conflict_do_update(
+            index_elements=[
+                InsightSnapshot.user_id,
+                InsightSnapshot.snapshot_month,
+            ],
+            set_=values,
+        )
+        .returning(
+            InsightSnapshot.snapshot_month,
+            InsightSnapshot.created_at,
         )
-        db.add(snapshot)
+    ).one()
 
     db.commit()
     return snapshot
@@ -607,7 +803,8 @@ def generate_insights_view(
     Generate LLM-based insights STRICTLY from analytics output.
 
     Behavior:
-    - force_refresh=True  → hard refresh (bypass all insight caches)
+    - force_refresh=True  → hard refresh (bypass all insight caches,
+                            analytics memo included)
     - force_refresh=False → normal cached behavior
 
     Guarantees:
@@ -620,9 +817,13 @@ def generate_insights_view(
     # --------------------------------------------------
     # 1️⃣ Authoritative analytics (single engine)
     # --------------------------------------------------
-    analytics = compute_analytics(
+    # Memoized on the transaction set: a repeat request with unchanged
+    # transactions skips the whole pandas pipeline
+    analytics = cached_compute_analytics(
         db=db,
-        user_id=user_id
+        user_id=user_id,
+        with_recent_sample=True,
+        refresh=force_refresh,
     )
 
     # --------------------------------------------------
@@ -646,49 +847,37 @@ def generate_insights_view(
     # --------------------------------------------------
     # 3️⃣ Lightweight transaction sample (patterns ONLY)
     # --------------------------------------------------
-    txns_sample = (
-        db.query(
-            Transaction.date,
-            Transaction.description,
-            Transaction.merchant,
-            Transaction.amount,
-            Transaction.category,
-        )
-        .join(Statement)
-        .filter(Statement.user_id == user_id)
-        .order_by(Transaction.date.desc())
-        .limit(50)
-        .all()
-    )
-
-    transaction_patterns_input = [
-        {
-            "date": t.date,
-            "description": t.description,
-            "merchant": t.merchant,
-            "amount": float(t.amount),
-            "category": t.category,
-        }
-        for t in txns_sample
-    ]
+    # Part of the (memoized) analytics payload: no second query
+    transaction_patterns_input = analytics["recent_sample"]
 
     # --------------------------------------------------
     # 4️⃣ LLM = explanation layer ONLY
     # --------------------------------------------------
-    financial_summary = generate_financial_summary(
-        metrics,
-        force_refresh=force_refresh
-    )
+    # The three generators are independent (own caches, own prompts):
+    # overlap their blocking LLM calls when the backend can run more than
+    # one at a time (the adapter semaphore still caps in-flight calls)
+    insight_calls = [
+        (generate_financial_summary, metrics),
+        (generate_category_insights, categories),
+        (generate_transaction_patterns, transaction_patterns_input),
+    ]
 
-    category_insights = generate_category_insights(
-        categories,
-        force_refresh=force_refresh
-    )
+    if is_llm_enabled() and LLM_CONCURRENCY > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(LLM_CONCURRENCY, len(insight_calls))
+        ) as ex:
+            futures = [
+                ex.submit(fn, data, force_refresh=force_refresh)
+                for fn, data in insight_calls
+            ]
+            results = [f.result() for f in futures]
+    else:
+        results = [
+            fn(data, force_refresh=force_refresh)
+            for fn, data in insight_calls
+        ]
 
-    transaction_patterns = generate_transaction_patterns(
-        transaction_patterns_input,
-        force_refresh=force_refresh
-    )
+    financial_summary, category_insights, transaction_patterns = results
 
     snapshot = _upsert_insight_snapshot(
         db=db,
@@ -725,8 +914,8 @@ def run_agent_view(*, db, user_id, goals=None):
     # 1️⃣ Fetch transactions
     # --------------------------------------------------
     txns = (
-        db.query(Transaction)
-        .join(Statement)
+        db.query(*TRANSACTION_DF_COLUMNS)
+        .join(Statement, Transaction.statement_id == Statement.id)
         .filter(Statement.user_id == user_id)
         .all()
     )
@@ -751,7 +940,7 @@ def run_agent_view(*, db, user_id, goals=None):
             db.query(FinancialGoal)
             .filter(
                 FinancialGoal.user_id == user_id,
-                FinancialGoal.is_active.is_(True),
+                FinancialGoal.is_active,
             )
             .all()
         )
@@ -0,0 +1,118 @@
+import os
+import time
+from threading import Lock
+
+from llm.adapter import json_dumps, json_loads
+
+try:
+    import redis
+except ImportError:  # optional: in-process cache fallback
+    redis = None
+
+
+# ==================================================
+# PER-USER RESPONSE CACHE (ANALYTICS / INSIGHTS)
+# ==================================================
+# Responses only change when the user's transactions do, so they are
+# cached until the next upload / correction invalidates them (TTL as a
+# backstop). Redis is used when REDIS_URL is set, so every worker shares
+# the cache; otherwise each process keeps its own.
+REDIS_URL = os.getenv("REDIS_URL")
+
+# A per-process cache is only correct in a single process: invalidate_user
+# cannot reach other workers, which would keep serving stale responses
+# until the TTL. gunicorn.conf.py sets RESPONSE_CACHE_LOCAL=false when it
+# runs several workers without Redis, and the fallback is then off.
+RESPONSE_CACHE_LOCAL = (
+    os.getenv("RESPONSE_CACHE_LOCAL", "true").lower() == "true"
+)
+
+try:
+    RESPONSE_CACHE_TTL_S = int(os.getenv("RESPONSE_CACHE_TTL_S", "3600"))
+except ValueError:
+    RESPONSE_CACHE_TTL_S = 3600
+
+_redis = (
+    redis.Redis.from_url(REDIS_URL)
+    if redis is not None and REDIS_URL
+    else None
+)
+
+_LOCAL_CACHE: dict[str, tuple[float, bytes]] = {}
+_LOCAL_CACHE_MAX = 1024
+_LOCAL_CACHE_LOCK = Lock()
+
+
+def analytics_key(user_id: int, month: str | None, period: str | None) -> str:
+    return f"analytics:{user_id}:{month or ''}:{period or ''}"
+
+
+def insights_key(user_id: int) -> str:
+    return f"insights:{user_id}"
+
+
+def get_cached(key: str):
+    """
+    Cached payload (a fresh object on every call) or None.
+    """
+    if _redis is not None:
+        try:
+            data = _redis.get(key)
+        except redis.RedisError as e:
+            print("⚠️ Response cache read failed:", e)
+            return None
+    elif not RESPONSE_CACHE_LOCAL:
+        return None
+    else:
+        with _LOCAL_CACHE_LOCK:
+            entry = _LOCAL_CACHE.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                del _LOCAL_CACHE[key]
+                entry = None
+        data = entry[1] if entry else None
+
+    return json_loads(data) if data is not None else None
+
+
+def set_cached(key: str, payload) -> None:
+    if _redis is None and not RESPONSE_CACHE_LOCAL:
+        return
+
+    try:
+        data = json_dumps(payload)
+    except TypeError as e:
+        print(f"⚠️ Response not cached ({key}): not JSON-serializable:", e)
+        return
+
+    if _redis is not None:
+        try:
+            _redis.setex(key, RESPONSE_CACHE_TTL_S, data)
+        except redis.RedisError as e:
+            print("⚠️ Response cache write failed:", e)
+        return
+
+    with _LOCAL_CACHE_LOCK:
+        if len(_LOCAL_CACHE) >= _LOCAL_CACHE_MAX:
+            _LOCAL_CACHE.clear()
+        _LOCAL_CACHE[key] = (time.monotonic() + RESPONSE_CACHE_TTL_S, data)
+
+
+def invalidate_user(user_id: int) -> None:
+    """
+    Drop every cached analytics / insights response of a user.
+    Call after anything that changes their transactions.
+    """
+    if _redis is not None:
+        try:
+            keys = list(_redis.scan_iter(match=f"analytics:{user_id}:*"))
+            keys.append(insights_key(user_id))
+            _redis.delete(*keys)
+        except redis.RedisError as e:
+            print("⚠️ Response cache invalidation failed:", e)
+        return
+
+    prefix = f"analytics:{user_id}:"
+    with _LOCAL_CACHE_LOCK:
+        for key in [k for k in _LOCAL_CACHE if k.startswith(prefix)]:
+            del _LOCAL_CACHE[key]
+        _LOCAL_CACHE.pop(insights_key(user_id), None)
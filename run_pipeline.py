@@ -1,11 +1,14 @@
-from pathlib import Path
+from functools import partial
 
 # ==================================================
 # PDF INTELLIGENCE PIPELINE
 # ==================================================
 from pdf_intelligence.stage1_layout import extract_layout
 from pdf_intelligence.stage2_tables import detect_candidate_rows
-from pdf_intelligence.stage6_orchestrator import choose_best_hypothesis
+from pdf_intelligence.stage6_orchestrator import (
+    build_row_features,
+    choose_best_hypothesis,
+)
 from pdf_intelligence.stage7_retry import retry_with_variants
 from pdf_intelligence.stage8_llm_arbitration import llm_arbitrate
 from pdf_intelligence.stage9_extraction import extract_transactions
@@ -13,8 +16,12 @@ from pdf_intelligence.stage9_extraction import extract_transactions
 # ==================================================
 # ANALYTICS
 # ==================================================
-from analytics.storage import save_transactions_csv
-from analytics.metrics import compute_metrics_from_csv
+from analytics.storage import (
+    transactions_frame,
+    write_transactions_csv,
+    DEFAULT_CSV_PATH,
+)
+from analytics.metrics import compute_metrics_from_df
 from analytics.categorization import (
     add_categories,
     category_summary,
@@ -38,9 +45,17 @@ from agent.insights.category_insights import generate_category_insights
 # ==================================================
 PDF_PATH = r"/Users/sohamathawale/Downloads/Account_November 2025_XX6735.pdf"
 
-CSV_PATH = Path(
-    "/Users/sohamathawale/Documents/GitHub/Personal-financeAgent/output/transactions_clean.csv"
-)
+CSV_PATH = DEFAULT_CSV_PATH
+
+
+# ==================================================
+# HELPERS
+# ==================================================
+def print_lines(lines):
+    """One write per block instead of one print() per line."""
+    lines = list(lines)
+    if lines:
+        print("\n".join(lines))
 
 
 # ==================================================
@@ -55,171 +70,187 @@ user_profile = UserProfile(
 
 
 # ==================================================
-# STAGES 1–2: LAYOUT + CANDIDATE ROWS
-# ==================================================
-words = extract_layout(PDF_PATH)
-rows = detect_candidate_rows(words)
+# MAIN
+# ==================================================
+def main(pdf_path: str = PDF_PATH) -> dict:
+    """
+    Run the full pipeline on one statement PDF. Nothing runs at import
+    time, so helpers here can be imported (or the module used from
+    worker processes) without parsing a PDF.
+    """
+    # ==================================================
+    # STAGES 1–2: LAYOUT + CANDIDATE ROWS
+    # ==================================================
+    words = extract_layout(pdf_path)
+    rows = detect_candidate_rows(words)
+
+
+    # ==================================================
+    # STAGE 6: SCHEMA DETECTION
+    # ==================================================
+    # Dates + amount words extracted once; retry variants reuse the rows
+    choose = partial(choose_best_hypothesis, features=build_row_features(rows))
+
+    schema, confidence = choose(rows)
+
+    if confidence >= 0.9:
+        final = {
+            "schema": schema,
+            "confidence": confidence,
+            "decision": "accepted"
+        }
+    else:
+        final = retry_with_variants(rows, choose)
+        if final["decision"] == "needs_arbitration":
+            arb = llm_arbitrate(final.get("candidates", []))
+            if arb:
+                final = arb
+
+    print("\nFINAL RESULT:")
+    print(final)
+
+
+    # ==================================================
+    # STAGE 9: TRANSACTION EXTRACTION
+    # ==================================================
+    if not final.get("schema"):
+        raise RuntimeError("❌ Transactions not extracted")
+
+    transactions = extract_transactions(
+        rows=rows,
+        schema=final["schema"],
+        confidence=final["confidence"],
+        source_pdf=pdf_path
+    )
 
+    print(f"\n✅ Extracted {len(transactions)} transactions")
 
-# ==================================================
-# STAGE 6: SCHEMA DETECTION
-# ==================================================
-schema, confidence = choose_best_hypothesis(rows)
 
-if confidence >= 0.9:
-    final = {
-        "schema": schema,
-        "confidence": confidence,
-        "decision": "accepted"
-    }
-else:
-    final = retry_with_variants(rows, choose_best_hypothesis)
-    if final["decision"] == "needs_arbitration":
-        arb = llm_arbitrate(final.get("candidates", []))
-        if arb:
-            final = arb
+    # ==================================================
+    # STAGE 10: STORAGE (IDEMPOTENT)
+    # ==================================================
+    # The CSV is an archival handoff; metrics use the same frame in memory
+    # instead of re-reading it
+    df = transactions_frame(transactions)
+    write_transactions_csv(df, CSV_PATH)
 
-print("\nFINAL RESULT:")
-print(final)
 
+    # ==================================================
+    # STAGE 10.5: METRICS (BANK-AUTHORITATIVE)
+    # ==================================================
+    metrics, df_txn = compute_metrics_from_df(df)
 
-# ==================================================
-# STAGE 9: TRANSACTION EXTRACTION
-# ==================================================
-if not final.get("schema"):
-    raise RuntimeError("❌ Transactions not extracted")
-
-transactions = extract_transactions(
-    rows=rows,
-    schema=final["schema"],
-    confidence=final["confidence"],
-    source_pdf=PDF_PATH
-)
+    print("\n📊 METRICS (Authoritative)")
+    print(metrics)
 
-print(f"\n✅ Extracted {len(transactions)} transactions")
 
+    # ==================================================
+    # STAGE 10.6: LLM-FIRST CATEGORIZATION
+    # ==================================================
+    df_txn = add_categories(df_txn)
 
-# ==================================================
-# STAGE 10: STORAGE (IDEMPOTENT)
-# ==================================================
-save_transactions_csv(transactions)
 
+    # ==================================================
+    # VIEW 1: EXPENSE-ONLY CATEGORY SPENDING
+    # ==================================================
+    category_spending = category_summary(df_txn)
 
-# ==================================================
-# STAGE 10.5: METRICS (BANK-AUTHORITATIVE)
-# ==================================================
-metrics, df_txn = compute_metrics_from_csv(csv_path=CSV_PATH)
+    print("\n📂 CATEGORY-WISE SPENDING (Expenses Only)")
+    print(category_spending)
 
-print("\n📊 METRICS (Authoritative)")
-print(metrics)
 
+    # ==================================================
+    # VIEW 2: ALL DEBITS (ACCOUNT-LEVEL TRUTH)
+    # ==================================================
+    all_debits = category_summary_all_debits(df_txn)
 
-# ==================================================
-# STAGE 10.6: LLM-FIRST CATEGORIZATION
-# ==================================================
-df_txn = add_categories(df_txn)
+    print("\n📤 CATEGORY-WISE DEBITS (Including Transfers)")
+    print(all_debits)
 
 
-# ==================================================
-# VIEW 1: EXPENSE-ONLY CATEGORY SPENDING
-# ==================================================
-category_spending = category_summary(df_txn)
+    # ==================================================
+    # DEBUG VIEW: LOW-CONFIDENCE / FALLBACK TRANSACTIONS
+    # ==================================================
+    # Rows and printed columns selected in one .loc (read-only: no .copy())
+    debug_df = df_txn.loc[
+        (df_txn["category_source"] == "fallback") |
+        (df_txn["category_confidence"] < 0.7),
+        [
+            "date",
+            "description",
+            "merchant",
+            "amount",
+            "category",
+            "category_confidence",
+            "category_source"
+        ]
+    ]
 
-print("\n📂 CATEGORY-WISE SPENDING (Expenses Only)")
-print(category_spending)
+    if not debug_df.empty:
+        print("\n🧪 LOW-CONFIDENCE / FALLBACK TRANSACTIONS")
+        print(debug_df.sort_values("amount"))
 
 
-# ==================================================
-# VIEW 2: ALL DEBITS (ACCOUNT-LEVEL TRUTH)
-# ==================================================
-all_debits = category_summary_all_debits(df_txn)
+    # ==================================================
+    # STAGE 10.7: UPI COUNTERPARTY INTELLIGENCE
+    # ==================================================
+    upi_summary = upi_counterparty_summary(df_txn)
 
-print("\n📤 CATEGORY-WISE DEBITS (Including Transfers)")
-print(all_debits)
+    print("\n🔁 TOP UPI COUNTERPARTIES")
+    print(upi_summary)
 
-
-# ==================================================
-# DEBUG VIEW: LOW-CONFIDENCE / FALLBACK TRANSACTIONS
-# ==================================================
-debug_df = df_txn[
-    (df_txn["category_source"] == "fallback") |
-    (df_txn["category_confidence"] < 0.7)
-].copy()
-
-if not debug_df.empty:
-    print("\n🧪 LOW-CONFIDENCE / FALLBACK TRANSACTIONS")
-    print(
-        debug_df[
-            [
-                "date",
-                "description",
-                "merchant",
-                "amount",
-                "category",
-                "category_confidence",
-                "category_source"
-            ]
-        ].sort_values("amount")
+    metrics["top_upi_counterparties"] = (
+        upi_summary.to_dict(orient="records")
     )
 
 
-# ==================================================
-# STAGE 10.7: UPI COUNTERPARTY INTELLIGENCE
-# ==================================================
-upi_summary = upi_counterparty_summary(df_txn)
+    # ==================================================
+    # STAGE 11: LLM INSIGHTS (SAFE INPUTS ONLY)
+    # ==================================================
+    financial_summary = generate_financial_summary(metrics)
 
-print("\n🔁 TOP UPI COUNTERPARTIES")
-print(upi_summary)
-
-metrics["top_upi_counterparties"] = (
-    upi_summary.to_dict(orient="records")
-)
+    transaction_patterns = generate_transaction_patterns(
+        df_txn[["date", "description"]].to_dict(orient="records")
+    )
 
+    category_insights = generate_category_insights(
+        category_spending.to_dict(orient="records")
+    )
 
-# ==================================================
-# STAGE 11: LLM INSIGHTS (SAFE INPUTS ONLY)
-# ==================================================
-financial_summary = generate_financial_summary(metrics)
+    print("\n📊 FINANCIAL SUMMARY (LLM)")
+    print(financial_summary)
 
-transaction_patterns = generate_transaction_patterns(
-    df_txn[["date", "description"]].to_dict(orient="records")
-)
+    print("\n🔍 TRANSACTION PATTERNS (LLM)")
+    print(transaction_patterns)
 
-category_insights = generate_category_insights(
-    category_spending.to_dict(orient="records")
-)
+    print("\n📂 CATEGORY INSIGHTS (LLM)")
+    print(category_insights)
 
-print("\n📊 FINANCIAL SUMMARY (LLM)")
-print(financial_summary)
 
-print("\n🔍 TRANSACTION PATTERNS (LLM)")
-print(transaction_patterns)
+    # ==================================================
+    # STAGE 12: AGENTIC AI
+    # ==================================================
+    agent_result = run_agent(
+        df=df_txn,
+        metrics=metrics,
+        user=user_profile
+    )
 
-print("\n📂 CATEGORY INSIGHTS (LLM)")
-print(category_insights)
+    print("\n🧠 AGENTIC AI OUTPUT")
 
+    print("\n📌 Financial State:")
+    print_lines(f"  {k}: {v}" for k, v in agent_result["state"].items())
 
-# ==================================================
-# STAGE 12: AGENTIC AI
-# ==================================================
-agent_result = run_agent(
-    df=df_txn,
-    metrics=metrics,
-    user=user_profile
-)
+    print(f"\n📈 Forecasted Month-End Balance: ₹{agent_result['forecast_balance']}")
 
-print("\n🧠 AGENTIC AI OUTPUT")
+    print("\n⚡ Agent Actions:")
+    print_lines(f"  - {a}" for a in agent_result["actions"])
 
-print("\n📌 Financial State:")
-for k, v in agent_result["state"].items():
-    print(f"  {k}: {v}")
+    print("\n🗣️ Agent Responses:")
+    print_lines(f"  • {r}" for r in agent_result["responses"])
 
-print(f"\n📈 Forecasted Month-End Balance: ₹{agent_result['forecast_balance']}")
+    return {"metrics": metrics, "agent": agent_result}
 
-print("\n⚡ Agent Actions:")
-for a in agent_result["actions"]:
-    print(f"  - {a}")
 
-print("\n🗣️ Agent Responses:")
-for r in agent_result["responses"]:
-    print(f"  • {r}")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import datetime
+import unittest
+
+from tests.support import add_transactions, load_app, login, requires_db
+
+
+@requires_db
+class CorrectBulkTest(unittest.TestCase):
+    URL = "/api/transactions/correct_bulk"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = load_app().test_client()
+
+        cls.owner_id, cls.owner = login(cls.client, "owner@example.com", "1")
+        _, cls.other = login(cls.client, "other@example.com", "2")
+
+        cls.tx_ids = add_transactions(cls.owner_id, [
+            (datetime.date(2025, 1, 5), "UPI/ZOMATO/1", -250.0),
+            (datetime.date(2025, 1, 6), "UPI/UBER/2", -120.0),
+        ])
+
+    def _categories(self):
+        body = self.client.get("/api/transactions", headers=self.owner).json
+        return {t["id"]: t["category"] for t in body["transactions"]}
+
+    def _correct(self, payload, headers=None):
+        return self.client.post(
+            self.URL, json=payload, headers=headers or self.owner
+        )
+
+    def test_validation_errors(self):
+        tx_id = self.tx_ids[0]
+        cases = {
+            "no list": {},
+            "empty list": {"corrections": []},
+            "not a dict": {"corrections": [tx_id]},
+            "missing category": {
+                "corrections": [{"transaction_id": tx_id, "merchant": "Z"}]
+            },
+            "string id": {
+                "corrections": [{
+                    "transaction_id": str(tx_id),
+                    "merchant": "Z",
+                    "category": "Food",
+                }]
+            },
+            "bool id": {
+                "corrections": [{
+                    "transaction_id": True,
+                    "merchant": "Z",
+                    "category": "Food",
+                }]
+            },
+        }
+
+        for name, payload in cases.items():
+            with self.subTest(case=name):
+                self.assertEqual(self._correct(payload).status_code, 400)
+
+        self.assertIsNone(self._categories()[tx_id])
+
+    def test_other_users_transactions_are_not_touched(self):
+        r = self._correct(
+            {"corrections": [{
+                "transaction_id": self.tx_ids[0],
+                "merchant": "ZOMATO",
+                "category": "Food",
+            }]},
+            headers=self.other,
+        )
+
+        self.assertEqual(r.status_code, 404)
+        self.assertEqual(r.json["transaction_ids"], [self.tx_ids[0]])
+        self.assertIsNone(self._categories()[self.tx_ids[0]])
+
+    def test_owner_corrections_applied(self):
+        r = self._correct({"corrections": [
+            {"transaction_id": self.tx_ids[1], "merchant": "UBER",
+             "category": "Food"},
+            # Last correction for a transaction wins
+            {"transaction_id": self.tx_ids[1], "merchant": "UBER",
+             "category": "Transport"},
+        ]})
+
+        self.assertEqual(r.status_code, 200)
+        self.assertEqual(r.json["updated"], 1)
+        self.assertEqual(self._categories()[self.tx_ids[1]], "Transport")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import math
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from analytics import metrics
+
+
+def _frame(rows):
+    return pd.DataFrame(
+        rows,
+        columns=[
+            "date", "description", "deposit", "withdrawal",
+            "balance", "confidence",
+        ],
+    ).assign(date=lambda d: pd.to_datetime(d["date"]))
+
+
+NAN_ROWS = [
+    ("2025-11-01", "salary", 100.0, 0.0, 1100.0, 1.0),
+    ("2025-11-03", "upi", np.nan, 40.0, 1060.0, 1.0),
+    ("2025-12-01", "salary", 200.0, np.nan, 1260.0, 1.0),
+]
+
+
+class MonthlyTotalsNaNTest(unittest.TestCase):
+    def test_reduceat_skips_nan(self):
+        with mock.patch.object(metrics, "_segment_sums", None):
+            out = metrics._monthly_totals(_frame(NAN_ROWS))
+
+        self.assertEqual(out["month"].tolist(), ["2025-11", "2025-12"])
+        self.assertEqual(out["income"].tolist(), [100.0, 200.0])
+        self.assertEqual(out["expense"].tolist(), [40.0, 0.0])
+
+    def test_kernel_and_reduceat_match_groupby(self):
+        df = _frame(NAN_ROWS[::-1])  # unsorted: exercises the argsort
+
+        baseline = (
+            df.groupby(df["date"].dt.strftime("%Y-%m"))[
+                ["deposit", "withdrawal"]
+            ]
+            .sum()
+        )
+
+        paths = {"reduceat": None}
+        if metrics._segment_sums is not None:
+            paths["numba"] = metrics._segment_sums
+
+        for name, kernel in paths.items():
+            with self.subTest(path=name):
+                with mock.patch.object(metrics, "_segment_sums", kernel):
+                    out = metrics._monthly_totals(df)
+
+                self.assertEqual(out["month"].tolist(), baseline.index.tolist())
+                np.testing.assert_array_equal(
+                    out["income"].to_numpy(), baseline["deposit"].to_numpy()
+                )
+                np.testing.assert_array_equal(
+                    out["expense"].to_numpy(), baseline["withdrawal"].to_numpy()
+                )
+
+    def test_metrics_have_no_nan(self):
+        result, _ = metrics.compute_metrics_from_df(_frame(NAN_ROWS))
+
+        for row in result["monthly_timeseries"]:
+            for key in ("income", "expense", "savings"):
+                self.assertFalse(math.isnan(row[key]), (row, key))
+
+        self.assertEqual(result["monthly_timeseries"][0]["income"], 100.0)
+        self.assertEqual(result["monthly_timeseries"][0]["savings"], 60.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from analytics.llm_categorizer import looks_like_person_name
+from analytics.llm_name_classifier import heuristic_is_business
+
+
+class HeuristicIsBusinessTest(unittest.TestCase):
+    # Business keywords match as substrings (not whole words)
+    CASES = {
+        "SHOPPERS STOP": (True, 0.9),
+        "R K STORES": (True, 0.9),
+        "Costco": (True, 0.9),
+        "Decor House": (True, 0.9),
+        "S R ENTERPRISES": (True, 0.9),
+        "Amazon Pay India Pvt Ltd": (True, 0.9),
+        "Rajeev Kumar": (False, 0.8),
+        "Jio": (False, 0.8),
+        "RAJEEV KUMAR": (None, 0.0),
+        "": (None, 0.0),
+    }
+
+    def test_cases(self):
+        for name, expected in self.CASES.items():
+            with self.subTest(name=name):
+                self.assertEqual(heuristic_is_business(name), expected)
+
+
+class LooksLikePersonNameTest(unittest.TestCase):
+    CASES = {
+        "RAJEEV KUMAR": True,
+        "ARUNDHATI CHAIT": True,
+        "rajeev kumar": True,
+        "A B C D": True,
+        "Blue Tokai Cafe 42": False,
+        "SWIGGY1": True,
+        "": False,
+    }
+
+    def test_cases(self):
+        for name, expected in self.CASES.items():
+            with self.subTest(name=name):
+                self.assertEqual(looks_like_person_name(name), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
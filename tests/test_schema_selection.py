@@ -0,0 +1,155 @@
+import contextlib
+import random
+import unittest
+from unittest import mock
+
+from pdf_intelligence import stage4_validation
+from pdf_intelligence import stage6_orchestrator as orchestrator
+
+DUAL = {
+    "type": "dual",
+    "deposit_x": 380.0,
+    "withdrawal_x": 300.0,
+    "balance_x": 460.0,
+}
+
+
+def _word(text, x0):
+    return {"text": text, "x0": float(x0), "x1": float(x0) + 5.0 * len(text)}
+
+
+def statement(n=30, seed=0, noise=0.0, ref_column=False, single=False):
+    """
+    Synthetic statement rows: date, narration, optional decimal reference
+    column (extra hypotheses), withdrawal / deposit columns (or one
+    amount column when single=True) and a running balance. `noise` is
+    the share of rows with a misread balance.
+    """
+    rnd = random.Random(seed)
+    balance = 10000.0
+    rows = []
+
+    for i in range(n):
+        amount = round(rnd.uniform(10, 900), 2)
+        deposit = rnd.random() < 0.4
+        balance = round(balance + amount if deposit else balance - amount, 2)
+
+        shown = balance
+        if rnd.random() < noise:
+            shown = round(balance + rnd.uniform(5, 50), 2)
+
+        date = f"{1 + i % 28:02d}/{1 + i // 28:02d}/2025"  # increasing
+        row = [_word(date, 10), _word("UPI/PAYMENT", 80)]
+        if ref_column:
+            row.append(_word(f"{rnd.randint(100, 999)}.{rnd.randint(10, 99)}", 220))
+        amount_x = 380 if single or deposit else 300
+        row.append(_word(f"{amount:.2f}", amount_x))
+        row.append(_word(f"{shown:.2f}", 460))
+        rows.append(row)
+
+    return rows
+
+
+def _full_validate(rows, h, amount_index=None, min_confidence=None):
+    # Reference run: never prune
+    return stage4_validation.validate_hypothesis(rows, h, amount_index, None)
+
+
+def _validation_paths():
+    paths = {"python": (None, None)}
+    if stage4_validation._validate_single_nb is not None:
+        paths["numba"] = (
+            stage4_validation._validate_single_nb,
+            stage4_validation._validate_dual_nb,
+        )
+    return paths
+
+
+@contextlib.contextmanager
+def _path(kernels):
+    single_nb, dual_nb = kernels
+    with mock.patch.object(stage4_validation, "_validate_single_nb", single_nb), \
+            mock.patch.object(stage4_validation, "_validate_dual_nb", dual_nb), \
+            mock.patch("builtins.print"):
+        yield
+
+
+class BranchAndBoundTest(unittest.TestCase):
+    def _pruned_and_full(self, rows):
+        pruned = orchestrator.choose_best_hypothesis(rows)
+        with mock.patch.object(orchestrator, "validate_hypothesis", _full_validate):
+            full = orchestrator.choose_best_hypothesis(rows)
+        return pruned, full
+
+    def test_pruning_matches_full_run(self):
+        statements = {
+            f"seed={seed} ref={ref} single={single}": statement(
+                seed=seed, noise=0.2, ref_column=ref, single=single
+            )
+            for seed in range(4)
+            for ref in (False, True)
+            for single in (False, True)
+        }
+
+        for path, kernels in _validation_paths().items():
+            for name, rows in statements.items():
+                with self.subTest(path=path, statement=name), _path(kernels):
+                    pruned, full = self._pruned_and_full(rows)
+                    self.assertEqual(pruned, full)
+                    self.assertIsNotNone(pruned[0])
+
+    def test_pruning_happens(self):
+        rows = statement(seed=0, noise=0.2, ref_column=True)
+        results = []
+
+        def spy(*args, **kwargs):
+            res = stage4_validation.validate_hypothesis(*args, **kwargs)
+            results.append(res)
+            return res
+
+        with _path((None, None)), \
+                mock.patch.object(orchestrator, "validate_hypothesis", spy):
+            orchestrator.choose_best_hypothesis(rows)
+
+        self.assertIn(None, results)
+
+    def test_dual_single_tie(self):
+        # Clean dual statement: both single hypotheses (withdrawal or
+        # deposit column as the signed amount) also reconcile fully, so
+        # dual and single tie on confidence and DUAL_BOOST decides
+        rows = statement(seed=7, ref_column=True)
+
+        for h in (
+            {"type": "single", "amount_x": 300.0, "balance_x": 460.0},
+            {"type": "single", "amount_x": 380.0, "balance_x": 460.0},
+        ):
+            res = stage4_validation.validate_hypothesis(rows, h)
+            self.assertEqual(res["errors"], 0)
+
+        for path, kernels in _validation_paths().items():
+            with self.subTest(path=path), _path(kernels):
+                pruned, full = self._pruned_and_full(rows)
+                self.assertEqual(pruned, full)
+                self.assertEqual(pruned, (DUAL, 1.0))
+
+    def test_variant_in_same_order_is_not_revalidated(self):
+        rows = statement(seed=3, noise=0.2, ref_column=True)
+        features = orchestrator.build_row_features(rows)
+
+        with _path((None, None)):
+            first = orchestrator.choose_best_hypothesis(rows, features=features)
+
+            # Dates are increasing, so the reversed variant sorts back
+            # to the same order and is answered from features["results"]
+            with mock.patch.object(
+                orchestrator, "validate_hypothesis", side_effect=AssertionError
+            ):
+                again = orchestrator.choose_best_hypothesis(
+                    rows[::-1], features=features
+                )
+
+        self.assertIs(again, first)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+
+from analytics.storage import (
+    compute_transaction_fingerprint,
+    compute_transaction_fingerprints,
+)
+
+
+class TransactionFingerprintTest(unittest.TestCase):
+    def test_batch_matches_scalar(self):
+        txns = [
+            {"date": "2025-01-05", "amount": -250.0,
+             "description": "  UPI/ZOMATO/1 "},
+            {"date": "2025-01-05", "amount": -250.0,
+             "description": "UPI/ZOMATO/1", "description_norm": ""},
+            {"date": "2025-01-05", "amount": -250.0,
+             "description": "UPI/ZOMATO/1", "description_norm": None},
+            {"date": "2025-01-06", "amount": 10.5,
+             "description": "SALARY", "description_norm": "salary"},
+        ]
+
+        self.assertEqual(
+            compute_transaction_fingerprints(txns).tolist(),
+            [compute_transaction_fingerprint(t) for t in txns],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
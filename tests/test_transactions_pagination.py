@@ -0,0 +1,99 @@
+import base64
+import datetime
+import unittest
+
+from tests.support import add_transactions, load_app, login, requires_db
+
+
+@requires_db
+class TransactionsPaginationTest(unittest.TestCase):
+    URL = "/api/transactions"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.client = load_app().test_client()
+        user_id, cls.headers = login(cls.client, "pager@example.com", "1")
+
+        # Several rows per date: the (date, id) keyset must page through
+        # ties without a gap or a duplicate
+        rows = [
+            (datetime.date(2025, 1, 1 + i // 3), f"TXN {i}", -10.0 - i)
+            for i in range(9)
+        ]
+        cls.tx_ids = add_transactions(user_id, rows)
+
+    def _get(self, **params):
+        return self.client.get(self.URL, query_string=params, headers=self.headers)
+
+    def test_pages_cover_every_row_once(self):
+        full = [t["id"] for t in self._get().json["transactions"]]
+
+        seen = []
+        pages = 0
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            body = self._get(**params).json
+
+            seen += [t["id"] for t in body["transactions"]]
+            pages += 1
+            cursor = body["next_cursor"]
+            if not cursor:
+                break
+
+        self.assertEqual(seen, full)
+        self.assertEqual(sorted(seen), sorted(self.tx_ids))
+        self.assertEqual(pages, 5)
+
+    def test_page_boundary_inside_equal_dates(self):
+        # limit=4 ends page one in the middle of the second date's rows
+        first = self._get(limit=4).json
+        second = self._get(limit=4, cursor=first["next_cursor"]).json
+
+        ids_1 = [t["id"] for t in first["transactions"]]
+        ids_2 = [t["id"] for t in second["transactions"]]
+
+        self.assertEqual(
+            first["transactions"][-1]["date"],
+            second["transactions"][0]["date"],
+        )
+        self.assertFalse(set(ids_1) & set(ids_2))
+        self.assertEqual(
+            ids_1 + ids_2,
+            [t["id"] for t in self._get().json["transactions"]][:8],
+        )
+
+    def test_cursor_round_trip(self):
+        first = self._get(limit=3).json
+        last = first["transactions"][-1]
+
+        import app
+
+        self.assertEqual(
+            app._decode_tx_cursor(first["next_cursor"]),
+            (datetime.date.fromisoformat(last["date"]), last["id"]),
+        )
+
+    def test_invalid_cursor(self):
+        def b64(raw: bytes) -> str:
+            return base64.urlsafe_b64encode(raw).decode()
+
+        cursors = {
+            "garbage": "zzz",
+            "no separator": b64(b"2025-01-01"),
+            "bad date": b64(b"2025-13-40|5"),
+            "bad id": b64(b"2025-01-01|abc"),
+            "not utf-8": b64(b"\xff\xfe|1"),
+        }
+
+        for name, cursor in cursors.items():
+            with self.subTest(cursor=name):
+                r = self._get(limit=2, cursor=cursor)
+                self.assertEqual(r.status_code, 400)
+                self.assertEqual(r.json, {"message": "invalid cursor"})
+
+
+if __name__ == "__main__":
+    unittest.main()